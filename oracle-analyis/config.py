@@ -21,9 +21,21 @@ class Config:
     BATCH_SIZE: int = int(os.getenv('BATCH_SIZE', '2000'))
     MAX_RETRIES: int = int(os.getenv('MAX_RETRIES', '3'))
     DELAY_BETWEEN_REQUESTS: float = float(os.getenv('DELAY_BETWEEN_REQUESTS', '0.1'))
+    RPC_BATCH_SIZE: int = int(os.getenv('RPC_BATCH_SIZE', '100'))
+    REQUEST_TIMEOUT: int = int(os.getenv('REQUEST_TIMEOUT', '30'))
+    HTTP_POOL_SIZE: int = int(os.getenv('HTTP_POOL_SIZE', '32'))
+    MAX_WORKERS: int = int(os.getenv('MAX_WORKERS', '16'))
+    BLOCK_CACHE_SIZE: int = int(os.getenv('BLOCK_CACHE_SIZE', '4096'))
+    ETHERSCAN_RPS: float = float(os.getenv('ETHERSCAN_RPS', '5'))
     
     # Output settings
     OUTPUT_DIR: str = os.getenv('OUTPUT_DIR', 'results')
+    BYTECODE_CACHE: str = os.getenv(
+        'BYTECODE_CACHE',
+        str(Path(OUTPUT_DIR) / 'bytecode_cache.sqlite')
+    )
+    ABI_CACHE_DIR: str = os.getenv('ABI_CACHE_DIR', str(Path(OUTPUT_DIR) / 'abi_cache'))
+    ABI_NEGATIVE_TTL: int = int(os.getenv('ABI_NEGATIVE_TTL', '3600'))
     
     @classmethod
     def validate(cls) -> Optional[str]:
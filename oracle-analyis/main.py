@@ -1,18 +1,22 @@
 # oracle_analysis/main.py
 import sys
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict
+import orjson
 import pandas as pd
 from web3 import Web3
 from web3.exceptions import Web3Exception
 
 from .config import Config
 from .market.events import MarketEventFetcher
-from .market.models import MarketEvent
+from .market.models import MarketEventBatch
+from .oracle.cache import OracleCache
 from .oracle.identifier import OracleIdentifier
-from .oracle.models import OracleType
+from .oracle.models import OracleIdentificationResult, OracleType
+from .utils.web3utils import PooledHTTPProvider
 
 # Configure logging
 logging.basicConfig(
@@ -32,13 +36,16 @@ class OracleAnalysis:
         Config.create_output_dir()
         
         # Initialize components
-        self.w3 = Web3(Web3.HTTPProvider(Config.RPC_URL))
+        self.w3 = Web3(PooledHTTPProvider(Config.RPC_URL))
         if not self.w3.is_connected():
             logger.error("Failed to connect to Ethereum node")
             sys.exit(1)
             
-        self.market_fetcher = MarketEventFetcher(Config.RPC_URL, Config.CONTRACT_ADDRESS)
-        self.oracle_identifier = OracleIdentifier(Config.RPC_URL)
+        self.market_fetcher = MarketEventFetcher(self.w3, Config.CONTRACT_ADDRESS)
+        self.oracle_identifier = OracleIdentifier(
+            self.w3,
+            cache=OracleCache(Config.BYTECODE_CACHE)
+        )
         
     def run_analysis(self) -> None:
         """Run the complete oracle analysis"""
@@ -73,58 +80,83 @@ class OracleAnalysis:
             logger.error(f"Unexpected error occurred: {e}")
             sys.exit(1)
     
-    def _analyze_oracles(self, market_events: List[MarketEvent]) -> Dict[str, Dict]:
+    def _analyze_oracles(
+        self,
+        market_events: MarketEventBatch
+    ) -> Dict[str, OracleIdentificationResult]:
         """Analyze oracle protocols for all unique oracle addresses"""
-        unique_oracles = {event.params.oracle for event in market_events}
+        unique_oracles = set(market_events.oracles)
         oracle_analysis = {}
         
-        for oracle_address in unique_oracles:
-            try:
-                analysis = self.oracle_identifier.identify_oracle(oracle_address)
-                oracle_analysis[oracle_address] = analysis
-            except Exception as e:
-                logger.warning(f"Failed to analyze oracle {oracle_address}: {e}")
-                oracle_analysis[oracle_address] = {
-                    'type': OracleType.UNKNOWN,
-                    'confidence': 0,
-                    'error': str(e)
-                }
+        # Identification is bound by eth_getCode round trips, so overlap them
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor:
+            futures = {
+                executor.submit(self.oracle_identifier.identify_oracle, oracle_address):
+                    oracle_address
+                for oracle_address in unique_oracles
+            }
+            
+            for future in as_completed(futures):
+                oracle_address = futures[future]
+                try:
+                    oracle_analysis[oracle_address] = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to analyze oracle {oracle_address}: {e}")
+                    oracle_analysis[oracle_address] = OracleIdentificationResult(
+                        oracle_type=OracleType.UNKNOWN,
+                        address=oracle_address,
+                        confidence=0.0,
+                        matched_functions=[],
+                        matched_storage=[],
+                        error=str(e)
+                    )
         
         return oracle_analysis
     
     def _generate_reports(
         self,
-        market_events: List[MarketEvent],
-        oracle_analysis: Dict[str, Dict]
+        market_events: MarketEventBatch,
+        oracle_analysis: Dict[str, OracleIdentificationResult]
     ) -> None:
         """Generate analysis reports"""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
-        # Create market events DataFrame
-        market_data = [{
-            'id': event.id,
-            'oracle': event.params.oracle,
-            'oracle_type': oracle_analysis[event.params.oracle]['type'].value,
-            'confidence': oracle_analysis[event.params.oracle]['confidence'],
-            'loan_token': event.params.loan_token,
-            'collateral_token': event.params.collateral_token,
-            'irm': event.params.irm,
-            'lltv': event.params.lltv,
-            'block_number': event.block_number,
-            'tx_hash': event.transaction_hash
-        } for event in market_events]
+        # The events are already stored column-wise; only the oracle
+        # columns need to be derived
+        market_analyses = [oracle_analysis[oracle] for oracle in market_events.oracles]
         
-        df_markets = pd.DataFrame(market_data)
+        df_markets = pd.DataFrame({
+            'id': market_events.ids,
+            'oracle': market_events.oracles,
+            'oracle_type': [analysis.oracle_type.value for analysis in market_analyses],
+            'confidence': [analysis.confidence for analysis in market_analyses],
+            'loan_token': market_events.loan_tokens,
+            'collateral_token': market_events.collateral_tokens,
+            'irm': market_events.irms,
+            'lltv': market_events.lltvs,
+            'block_number': market_events.block_numbers,
+            'tx_hash': market_events.transaction_hashes
+        })
         
-        # Create oracle analysis DataFrame
-        oracle_data = [{
-            'address': addr,
-            'type': analysis['type'].value,
-            'confidence': analysis['confidence'],
-            'error': analysis.get('error', None)
-        } for addr, analysis in oracle_analysis.items()]
+        # Use compact dtypes; lltv is a WAD-scaled fraction and fits in uint64
+        df_markets = df_markets.astype({
+            'block_number': 'uint32',
+            'oracle_type': 'category',
+            'confidence': 'float32',
+            'lltv': 'uint64'
+        })
         
-        df_oracles = pd.DataFrame(oracle_data)
+        # Create oracle analysis DataFrame
+        analyses = list(oracle_analysis.values())
+        df_oracles = pd.DataFrame({
+            'address': list(oracle_analysis.keys()),
+            'type': [analysis.oracle_type.value for analysis in analyses],
+            'confidence': [analysis.confidence for analysis in analyses],
+            'error': [analysis.error for analysis in analyses]
+        }).astype({
+            'type': 'category',
+            'confidence': 'float32'
+        })
         
         # Save reports
         output_dir = Path(Config.OUTPUT_DIR)
@@ -141,7 +173,10 @@ class OracleAnalysis:
         }
         
         # Save statistics
-        pd.Series(stats).to_json(output_dir / f'analysis_stats_{timestamp}.json')
+        (output_dir / f'analysis_stats_{timestamp}.json').write_bytes(orjson.dumps(
+            stats,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+        ))
         
         # Print summary
         logger.info("\nAnalysis Summary:")
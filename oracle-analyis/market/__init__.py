@@ -1,7 +1,7 @@
 # oracle_analysis/market/__init__.py
 """Market analysis module for oracle analysis package."""
-from .models import MarketParams, MarketEvent
+from .models import MarketParams, MarketEvent, MarketEventBatch
 from .events import MarketEventFetcher
 
-__all__ = ['MarketParams', 'MarketEvent', 'MarketEventFetcher']
+__all__ = ['MarketParams', 'MarketEvent', 'MarketEventBatch', 'MarketEventFetcher']
 
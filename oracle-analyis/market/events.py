@@ -1,6 +1,8 @@
 # oracle_analysis/market/events.py
 import logging
-from typing import List, Optional
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+import requests
 from web3 import Web3
 from web3.contract import Contract
 from web3.exceptions import BlockNotFound, ContractLogicError
@@ -9,7 +11,8 @@ from tqdm import tqdm
 import time
 
 from ..config import Config
-from .models import MarketEvent, MarketParams
+from ..utils.web3utils import get_block_timestamps, get_retry_after, to_checksum_address
+from .models import MarketEventBatch, MarketParams
 
 logger = logging.getLogger(__name__)
 
@@ -42,65 +45,98 @@ class MarketEventFetcher:
         "type": "event"
     }
 
-    def __init__(self, web3_provider: str, contract_address: str):
-        """Initialize the event fetcher."""
-        self.w3 = Web3(Web3.HTTPProvider(web3_provider))
+    def __init__(self, w3: Web3, contract_address: str):
+        """Initialize the event fetcher with a shared Web3 instance."""
+        self.w3 = w3
         self.contract = self.w3.eth.contract(
-            address=Web3.to_checksum_address(contract_address),
+            address=to_checksum_address(contract_address),
             abi=[self.EVENT_ABI]
         )
         self.retry_delay = Config.DELAY_BETWEEN_REQUESTS
         self.max_retries = Config.MAX_RETRIES
 
-    def _process_event(self, event: EventData) -> MarketEvent:
-        """Process a single event into a MarketEvent object."""
-        try:
-            # Get block timestamp
-            block = self.w3.eth.get_block(event['blockNumber'])
-            timestamp = block['timestamp'] if block else None
-
-            return MarketEvent(
-                id=event['args']['id'].hex(),
-                params=MarketParams.from_tuple(event['args']['marketParams']),
-                block_number=event['blockNumber'],
-                transaction_hash=event['transactionHash'].hex(),
-                timestamp=timestamp
-            )
-        except Exception as e:
-            logger.error(f"Error processing event: {e}")
-            raise
+    def _process_events(
+        self,
+        events: List[EventData],
+        timestamps: Dict[int, int]
+    ) -> MarketEventBatch:
+        """Process raw events into a columnar MarketEventBatch."""
+        batch = MarketEventBatch()
+        for event in events:
+            try:
+                batch.append(
+                    id=event['args']['id'].hex(),
+                    params=event['args']['marketParams'],
+                    block_number=event['blockNumber'],
+                    transaction_hash=event['transactionHash'].hex(),
+                    timestamp=timestamps.get(event['blockNumber'])
+                )
+            except Exception as e:
+                logger.error(f"Error processing event: {e}")
+                raise
+        return batch
 
     def fetch_events_batch(
         self,
         start_block: int,
         end_block: int,
+        include_timestamps: bool = False,
         retry_count: int = 0
-    ) -> List[MarketEvent]:
-        """Fetch events for a specific block range."""
+    ) -> MarketEventBatch:
+        """
+        Fetch events for a specific block range.
+        
+        Block timestamps cost an extra RPC round per batch and are only
+        looked up when include_timestamps is set.
+        """
         try:
-            event_filter = self.contract.events.CreateMarket.create_filter(
+            # Plain eth_getLogs: no node-side filter state, safe to run concurrently
+            events = self.contract.events.CreateMarket.get_logs(
                 fromBlock=start_block,
                 toBlock=end_block
             )
             
-            events = event_filter.get_all_entries()
-            return [self._process_event(event) for event in events]
+            timestamps = {}
+            if include_timestamps and events:
+                # Fetch all block timestamps in batched requests instead of one per event
+                timestamps = get_block_timestamps(
+                    self.w3,
+                    {event['blockNumber'] for event in events}
+                )
+            
+            return self._process_events(events, timestamps)
+            
+        except (BlockNotFound, ContractLogicError, requests.exceptions.HTTPError) as e:
+            # Of the HTTP errors, only rate limiting is worth retrying
+            is_http_error = isinstance(e, requests.exceptions.HTTPError)
+            if is_http_error and (e.response is None or e.response.status_code != 429):
+                raise
             
-        except (BlockNotFound, ContractLogicError) as e:
             if retry_count >= self.max_retries:
                 logger.error(f"Max retries reached for blocks {start_block}-{end_block}")
                 raise
+            
+            # Back off only when an error actually occurred, honoring Retry-After
+            delay = get_retry_after(e)
+            if delay is None:
+                delay = self.retry_delay * (retry_count + 1)
                 
             logger.warning(f"Retrying blocks {start_block}-{end_block} after error: {e}")
-            time.sleep(self.retry_delay * (retry_count + 1))
-            return self.fetch_events_batch(start_block, end_block, retry_count + 1)
+            time.sleep(delay)
+            return self.fetch_events_batch(
+                start_block,
+                end_block,
+                include_timestamps=include_timestamps,
+                retry_count=retry_count + 1
+            )
 
     def fetch_events(
         self,
         start_block: Optional[int] = None,
         end_block: Optional[int] = None,
-        batch_size: Optional[int] = None
-    ) -> List[MarketEvent]:
+        batch_size: Optional[int] = None,
+        include_timestamps: bool = False
+    ) -> MarketEventBatch:
         """
         Fetch all CreateMarket events between specified blocks.
         
@@ -108,9 +144,10 @@ class MarketEventFetcher:
             start_block: Starting block number (default: Config.START_BLOCK)
             end_block: Ending block number (default: latest block)
             batch_size: Number of blocks per batch (default: Config.BATCH_SIZE)
+            include_timestamps: Also fetch block timestamps (default: False)
         
         Returns:
-            List of MarketEvent objects
+            MarketEventBatch with the events in block order
         """
         start_block = start_block if start_block is not None else Config.START_BLOCK
         end_block = end_block if end_block is not None else self.w3.eth.block_number
@@ -119,18 +156,34 @@ class MarketEventFetcher:
         if start_block > end_block:
             raise ValueError("Start block cannot be greater than end block")
 
-        all_events = []
-        total_batches = (end_block - start_block) // batch_size + 1
+        block_ranges = [
+            (batch_start, min(batch_start + batch_size - 1, end_block))
+            for batch_start in range(start_block, end_block + 1, batch_size)
+        ]
+        batch_results: Dict[int, MarketEventBatch] = {}
 
         logger.info(f"Fetching events from block {start_block} to {end_block}")
         
-        with tqdm(total=total_batches, desc="Fetching events") as pbar:
-            for batch_start in range(start_block, end_block + 1, batch_size):
-                batch_end = min(batch_start + batch_size - 1, end_block)
+        # Batches are independent, so fetch them concurrently; the worker count
+        # bounds the number of in-flight requests against the node
+        with ThreadPoolExecutor(max_workers=Config.MAX_WORKERS) as executor, \
+                tqdm(total=len(block_ranges), desc="Fetching events") as pbar:
+            futures = {
+                executor.submit(
+                    self.fetch_events_batch,
+                    batch_start,
+                    batch_end,
+                    include_timestamps
+                ): (batch_start, batch_end)
+                for batch_start, batch_end in block_ranges
+            }
+            
+            for future in as_completed(futures):
+                batch_start, batch_end = futures[future]
                 
                 try:
-                    batch_events = self.fetch_events_batch(batch_start, batch_end)
-                    all_events.extend(batch_events)
+                    batch_events = future.result()
+                    batch_results[batch_start] = batch_events
                     
                     logger.debug(
                         f"Fetched {len(batch_events)} events for blocks "
@@ -141,11 +194,14 @@ class MarketEventFetcher:
                     logger.error(
                         f"Failed to fetch events for blocks {batch_start}-{batch_end}: {e}"
                     )
-                    continue
                 
                 finally:
                     pbar.update(1)
-                    time.sleep(self.retry_delay)
+
+        # Restore block order regardless of completion order
+        all_events = MarketEventBatch()
+        for batch_start in sorted(batch_results):
+            all_events.extend(batch_results[batch_start])
 
         logger.info(f"Fetched total of {len(all_events)} events")
         return all_events
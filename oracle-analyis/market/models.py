@@ -1,10 +1,27 @@
 # oracle_analysis/market/models.py
-from dataclasses import dataclass
-from typing import Optional
+from collections.abc import Mapping
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
 from web3.types import BlockIdentifier
 
-@dataclass
-class MarketParams:
+# Component names of the MarketParams struct in the Morpho Blue ABI, in order
+MARKET_PARAMS_FIELDS = ('loanToken', 'collateralToken', 'oracle', 'irm', 'lltv')
+
+def market_params_values(data: Any) -> Tuple[Any, ...]:
+    """
+    Get the decoded MarketParams struct fields in ABI order.
+    
+    web3 decodes struct event args into a dict keyed by component name;
+    plain tuples are read by position.
+    """
+    if isinstance(data, Mapping):
+        return tuple(data[name] for name in MARKET_PARAMS_FIELDS)
+    values = tuple(data)
+    if len(values) != len(MARKET_PARAMS_FIELDS):
+        raise ValueError(f"Expected {len(MARKET_PARAMS_FIELDS)} market params, got {len(values)}")
+    return values
+
+class MarketParams(NamedTuple):
     """Represents the parameters of a market."""
     loan_token: str
     collateral_token: str
@@ -13,15 +30,9 @@ class MarketParams:
     lltv: int
 
     @classmethod
-    def from_tuple(cls, data: tuple) -> 'MarketParams':
-        """Create MarketParams from contract event tuple."""
-        return cls(
-            loan_token=data[0],
-            collateral_token=data[1],
-            oracle=data[2],
-            irm=data[3],
-            lltv=data[4]
-        )
+    def from_tuple(cls, data: Any) -> 'MarketParams':
+        """Create MarketParams from a decoded contract event struct (dict or tuple)."""
+        return cls._make(market_params_values(data))
 
     def to_dict(self) -> dict:
         """Convert to dictionary format."""
@@ -33,8 +44,7 @@ class MarketParams:
             'lltv': self.lltv
         }
 
-@dataclass
-class MarketEvent:
+class MarketEvent(NamedTuple):
     """Represents a market creation event."""
     id: str
     params: MarketParams
@@ -52,3 +62,79 @@ class MarketEvent:
             **self.params.to_dict()
         }
 
+@dataclass
+class MarketEventBatch:
+    """
+    Market creation events stored column-wise, one list per field.
+    
+    Avoids building a MarketEvent and MarketParams object per event;
+    iterate the batch to get MarketEvent rows when needed.
+    """
+    ids: List[str] = field(default_factory=list)
+    loan_tokens: List[str] = field(default_factory=list)
+    collateral_tokens: List[str] = field(default_factory=list)
+    oracles: List[str] = field(default_factory=list)
+    irms: List[str] = field(default_factory=list)
+    lltvs: List[int] = field(default_factory=list)
+    block_numbers: List[int] = field(default_factory=list)
+    transaction_hashes: List[str] = field(default_factory=list)
+    timestamps: List[Optional[int]] = field(default_factory=list)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __iter__(self) -> Iterator[MarketEvent]:
+        """Yield the events as MarketEvent rows."""
+        for i in range(len(self.ids)):
+            yield MarketEvent(
+                id=self.ids[i],
+                params=MarketParams(
+                    loan_token=self.loan_tokens[i],
+                    collateral_token=self.collateral_tokens[i],
+                    oracle=self.oracles[i],
+                    irm=self.irms[i],
+                    lltv=self.lltvs[i]
+                ),
+                block_number=self.block_numbers[i],
+                transaction_hash=self.transaction_hashes[i],
+                timestamp=self.timestamps[i]
+            )
+
+    def append(
+        self,
+        id: str,
+        params: Any,
+        block_number: int,
+        transaction_hash: str,
+        timestamp: Optional[int] = None
+    ) -> None:
+        """Append one event, given its decoded market params struct (dict or tuple)."""
+        loan_token, collateral_token, oracle, irm, lltv = market_params_values(params)
+        self.ids.append(id)
+        self.loan_tokens.append(loan_token)
+        self.collateral_tokens.append(collateral_token)
+        self.oracles.append(oracle)
+        self.irms.append(irm)
+        self.lltvs.append(lltv)
+        self.block_numbers.append(block_number)
+        self.transaction_hashes.append(transaction_hash)
+        self.timestamps.append(timestamp)
+
+    def extend(self, other: 'MarketEventBatch') -> None:
+        """Append all events of another batch."""
+        for name, column in self.to_dict().items():
+            column.extend(getattr(other, name))
+
+    def to_dict(self) -> Dict[str, list]:
+        """Convert to a mapping of field name to column list."""
+        return {
+            'ids': self.ids,
+            'loan_tokens': self.loan_tokens,
+            'collateral_tokens': self.collateral_tokens,
+            'oracles': self.oracles,
+            'irms': self.irms,
+            'lltvs': self.lltvs,
+            'block_numbers': self.block_numbers,
+            'transaction_hashes': self.transaction_hashes,
+            'timestamps': self.timestamps
+        }
@@ -2,6 +2,7 @@
 """Oracle identification and analysis module."""
 from .models import OracleType, OraclePattern, OracleIdentificationResult
 from .identifier import OracleIdentifier
+from .cache import OracleCache
 from .patterns import (
     CHAINLINK_PATTERNS,
     TELLOR_PATTERNS,
@@ -15,6 +16,7 @@ __all__ = [
     'OraclePattern',
     'OracleIdentificationResult',
     'OracleIdentifier',
+    'OracleCache',
     'CHAINLINK_PATTERNS',
     'TELLOR_PATTERNS',
     'UNISWAP_PATTERNS',
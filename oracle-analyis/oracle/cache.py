@@ -0,0 +1,160 @@
+# oracle_analysis/oracle/cache.py
+"""Persistent cache for oracle bytecode and identification results."""
+import json
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from .models import OracleIdentificationResult
+
+logger = logging.getLogger(__name__)
+
+class OracleCache:
+    """
+    SQLite-backed cache for oracle analysis, keyed by contract address.
+    
+    Bytecode and the deployer of a contract are immutable, so entries never
+    expire.
+    Identification results are also keyed by a fingerprint of the oracle
+    patterns, so changing the patterns invalidates them.
+    """
+
+    def __init__(self, path: str):
+        """Open (or create) the cache database at the given path."""
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # One connection shared between worker threads, serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS bytecode (
+                address TEXT PRIMARY KEY,
+                code BLOB NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS creator (
+                address TEXT PRIMARY KEY,
+                creator TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS identification (
+                address TEXT NOT NULL,
+                fingerprint TEXT NOT NULL,
+                result TEXT NOT NULL,
+                PRIMARY KEY (address, fingerprint)
+            );
+        """)
+        
+        # In-process layer in front of the database
+        self._bytecode: Dict[str, bytes] = {}
+        self._creators: Dict[str, str] = {}
+        self._results: Dict[Tuple[str, str], OracleIdentificationResult] = {}
+
+    @staticmethod
+    def _key(address: str) -> str:
+        """Normalize an address into a cache key."""
+        return address.lower()
+
+    def get_bytecode(self, address: str) -> Optional[bytes]:
+        """Return cached bytecode for an address, if present."""
+        key = self._key(address)
+        if key in self._bytecode:
+            return self._bytecode[key]
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT code FROM bytecode WHERE address = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        self._bytecode[key] = bytes(row[0])
+        return self._bytecode[key]
+
+    def set_bytecode(self, address: str, code: bytes) -> None:
+        """Store bytecode for an address."""
+        key = self._key(address)
+        self._bytecode[key] = bytes(code)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO bytecode (address, code) VALUES (?, ?)",
+                (key, self._bytecode[key])
+            )
+            self._conn.commit()
+
+    def get_creator(self, address: str) -> Optional[str]:
+        """Return the cached deployer of a contract, if present."""
+        key = self._key(address)
+        if key in self._creators:
+            return self._creators[key]
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT creator FROM creator WHERE address = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        
+        self._creators[key] = row[0]
+        return row[0]
+
+    def set_creator(self, address: str, creator: str) -> None:
+        """Store the deployer of a contract."""
+        key = self._key(address)
+        self._creators[key] = creator
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO creator (address, creator) VALUES (?, ?)",
+                (key, creator)
+            )
+            self._conn.commit()
+
+    def get_result(
+        self,
+        address: str,
+        fingerprint: str
+    ) -> Optional[OracleIdentificationResult]:
+        """Return a cached identification result, if present."""
+        key = (self._key(address), fingerprint)
+        if key in self._results:
+            return self._results[key]
+        
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM identification WHERE address = ? AND fingerprint = ?",
+                key
+            ).fetchone()
+        if row is None:
+            return None
+        
+        try:
+            result = OracleIdentificationResult.from_dict(json.loads(row[0]))
+        except (KeyError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable cache entry for {address}: {e}")
+            return None
+        
+        self._results[key] = result
+        return result
+
+    def set_result(
+        self,
+        address: str,
+        fingerprint: str,
+        result: OracleIdentificationResult
+    ) -> None:
+        """Store an identification result."""
+        key = (self._key(address), fingerprint)
+        self._results[key] = result
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO identification (address, fingerprint, result) "
+                "VALUES (?, ?, ?)",
+                (*key, json.dumps(result.to_dict()))
+            )
+            self._conn.commit()
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
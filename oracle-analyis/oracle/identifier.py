@@ -0,0 +1,422 @@
+# oracle_analysis/oracle/identifier.py
+import hashlib
+import json
+import logging
+import re
+from typing import Dict, FrozenSet, Iterable, List, NamedTuple, Optional, Set, Tuple
+from web3 import Web3
+from web3.types import HexBytes
+
+from ..config import Config
+from ..utils.web3utils import get_contract_creator, to_checksum_address
+from .cache import OracleCache
+from .models import OracleType, OraclePattern, OracleIdentificationResult
+from .patterns import (
+    CHAINLINK_PATTERNS,
+    TELLOR_PATTERNS,
+    UNISWAP_PATTERNS,
+    PYTH_PATTERNS,
+    REDSTONE_PATTERNS
+)
+
+logger = logging.getLogger(__name__)
+
+def _patterns_can_overlap(patterns: Iterable[bytes]) -> bool:
+    """Check whether occurrences of two patterns could overlap in any bytecode."""
+    patterns = list(patterns)
+    for a in patterns:
+        for b in patterns:
+            for offset in range(len(a)):
+                if offset == 0 and a == b:
+                    continue
+                size = min(len(a) - offset, len(b))
+                if a[offset:offset + size] == b[:size]:
+                    return True
+    return False
+
+class _PatternSpec(NamedTuple):
+    """Constants precomputed from an OraclePattern for the identification loop."""
+    oracle_type: OracleType
+    pattern: OraclePattern
+    n_functions: int
+    n_storage: int
+    required: int
+    factories: FrozenSet[str]
+    max_confidence: float
+
+class OracleIdentifier:
+    """Identifies oracle protocols based on contract analysis."""
+
+    def __init__(self, w3: Web3, cache: Optional[OracleCache] = None):
+        """
+        Initialize the oracle identifier with a shared Web3 instance.
+        
+        If a cache is given, bytecode and identification results are
+        persisted there and reused across runs.
+        """
+        self.w3 = w3
+        self.cache = cache
+        self.patterns = {
+            OracleType.CHAINLINK: CHAINLINK_PATTERNS,
+            OracleType.TELLOR: TELLOR_PATTERNS,
+            OracleType.UNISWAP: UNISWAP_PATTERNS,
+            OracleType.PYTH: PYTH_PATTERNS,
+            OracleType.REDSTONE: REDSTONE_PATTERNS
+        }
+        
+        # Distinct patterns across all oracle types, mapped to their raw bytes;
+        # shared ones (e.g. decimals()) only need to be searched for once
+        self._unique_patterns: Dict[str, bytes] = {}
+        for pattern in self.patterns.values():
+            pairs = list(zip(pattern.function_patterns, pattern.function_patterns_bytes))
+            pairs += zip(pattern.storage_patterns, pattern.storage_patterns_bytes)
+            for p, p_bytes in pairs:
+                if p_bytes is not None:
+                    self._unique_patterns.setdefault(p, p_bytes)
+        
+        self._patterns_by_bytes: Dict[bytes, List[str]] = {}
+        for p, p_bytes in self._unique_patterns.items():
+            self._patterns_by_bytes.setdefault(p_bytes, []).append(p)
+        
+        # Compile every pattern into one alternation so a single regex scan
+        # finds all hits. Regex matches never overlap, so this is only exact
+        # when no two pattern occurrences can overlap; otherwise fall back to
+        # searching for each pattern separately.
+        self._pattern_regex = None
+        if self._patterns_by_bytes and not _patterns_can_overlap(self._patterns_by_bytes):
+            self._pattern_regex = re.compile(
+                b'|'.join(re.escape(p_bytes) for p_bytes in self._patterns_by_bytes)
+            )
+        
+        # Flat table of per-type constants, validated once up front
+        self._pattern_table = tuple(
+            self._compile_pattern(oracle_type, pattern)
+            for oracle_type, pattern in self.patterns.items()
+        )
+        
+        # Factory checks need the deployer from Etherscan; without an API key
+        # they are skipped and factory matches are reported as unknown
+        self.factory_check_available = bool(Config.ETHERSCAN_API_KEY)
+        if not self.factory_check_available:
+            logger.info("No Etherscan API key provided, skipping factory checks")
+        
+        # Cached results are only valid for the patterns and checks that produced them
+        self.patterns_fingerprint = hashlib.sha256(
+            json.dumps(
+                {
+                    'patterns': {oracle_type.value: pattern.to_dict()
+                                 for oracle_type, pattern in self.patterns.items()},
+                    'factory_check': self.factory_check_available
+                },
+                sort_keys=True
+            ).encode()
+        ).hexdigest()
+
+    def _compile_pattern(
+        self,
+        oracle_type: OracleType,
+        pattern: OraclePattern
+    ) -> _PatternSpec:
+        """Validate a pattern and precompute its identification constants."""
+        n_functions = len(pattern.function_patterns)
+        n_storage = len(pattern.storage_patterns)
+        
+        if not n_functions or not n_storage:
+            raise ValueError(
+                f"{oracle_type.value} pattern needs function and storage patterns"
+            )
+        if pattern.required_function_matches > n_functions:
+            raise ValueError(
+                f"{oracle_type.value} pattern requires more function matches "
+                f"than it defines"
+            )
+        
+        # Highest confidence the type can possibly reach. Storage patterns
+        # that cannot match and absent factory lists lower the bound.
+        matchable_storage = sum(
+            1 for p_bytes in pattern.storage_patterns_bytes if p_bytes is not None
+        )
+        max_confidence = self._score(
+            n_functions,
+            matchable_storage,
+            n_functions,
+            n_storage,
+            pattern.required_function_matches,
+            bool(pattern.factory_addresses)
+        )
+        
+        return _PatternSpec(
+            oracle_type=oracle_type,
+            pattern=pattern,
+            n_functions=n_functions,
+            n_storage=n_storage,
+            required=pattern.required_function_matches,
+            factories=frozenset(a.lower() for a in pattern.factory_addresses or []),
+            max_confidence=max_confidence
+        )
+
+    def get_contract_code(self, address: str) -> Optional[HexBytes]:
+        """Fetch contract bytecode, preferring the cache over the blockchain."""
+        if self.cache:
+            cached_code = self.cache.get_bytecode(address)
+            if cached_code:
+                return HexBytes(cached_code)
+        
+        try:
+            code = self.w3.eth.get_code(to_checksum_address(address))
+            if not code or code == HexBytes('0x'):
+                return None
+            
+            if self.cache:
+                self.cache.set_bytecode(address, code)
+            return code
+        except Exception as e:
+            logger.error(f"Error fetching code for {address}: {e}")
+            return None
+
+    def analyze_code_patterns(
+        self,
+        bytecode: bytes,
+        pattern: OraclePattern
+    ) -> Tuple[List[str], List[str]]:
+        """
+        Analyze raw bytecode against oracle patterns.
+        Returns tuple of (matched_functions, matched_storage).
+        """
+        matched_functions = [
+            p for p, p_bytes
+            in zip(pattern.function_patterns, pattern.function_patterns_bytes)
+            if p_bytes in bytecode
+        ]
+        
+        matched_storage = [
+            p for p, p_bytes
+            in zip(pattern.storage_patterns, pattern.storage_patterns_bytes)
+            if p_bytes is not None and p_bytes in bytecode
+        ]
+        
+        return matched_functions, matched_storage
+
+    def match_all_patterns(
+        self,
+        bytecode: bytes
+    ) -> Dict[OracleType, Tuple[List[str], List[str]]]:
+        """
+        Analyze raw bytecode against the patterns of every oracle type at once.
+        Returns mapping of oracle type to (matched_functions, matched_storage).
+        """
+        found = self._find_patterns(bytecode)
+        
+        return {
+            oracle_type: (
+                [p for p in pattern.function_patterns if p in found],
+                [p for p in pattern.storage_patterns if p in found]
+            )
+            for oracle_type, pattern in self.patterns.items()
+        }
+
+    def _find_patterns(self, bytecode: bytes) -> Set[str]:
+        """
+        Return every known pattern present in the bytecode.
+        Uses a single precompiled regex scan when possible.
+        """
+        if self._pattern_regex is not None:
+            found_bytes = set(self._pattern_regex.findall(bytecode))
+        else:
+            found_bytes = {
+                p_bytes for p_bytes in self._patterns_by_bytes
+                if p_bytes in bytecode
+            }
+        
+        return {p for p_bytes in found_bytes for p in self._patterns_by_bytes[p_bytes]}
+
+    def get_contract_creator(self, address: str) -> Optional[str]:
+        """
+        Fetch the deployer of a contract, preferring the cache over Etherscan.
+        Returns None if there is no creation record; raises if the lookup fails.
+        """
+        if self.cache:
+            cached_creator = self.cache.get_creator(address)
+            if cached_creator:
+                return cached_creator
+        
+        creator = get_contract_creator(address)
+        if creator and self.cache:
+            self.cache.set_creator(address, creator)
+        return creator
+
+    def calculate_confidence(
+        self,
+        matched_functions: List[str],
+        matched_storage: List[str],
+        pattern: OraclePattern,
+        factory_match: bool
+    ) -> float:
+        """Calculate confidence score for oracle identification."""
+        return self._score(
+            len(matched_functions),
+            len(matched_storage),
+            len(pattern.function_patterns),
+            len(pattern.storage_patterns),
+            pattern.required_function_matches,
+            factory_match
+        )
+
+    @staticmethod
+    def _score(
+        function_count: int,
+        storage_count: int,
+        n_functions: int,
+        n_storage: int,
+        required: int,
+        factory_match: bool
+    ) -> float:
+        """Calculate confidence score from match counts and pattern sizes."""
+        # Base confidence from function matches
+        func_ratio = function_count / n_functions
+        func_confidence = func_ratio * 0.6  # Functions are weighted at 60%
+        
+        # Storage pattern confidence
+        storage_ratio = storage_count / n_storage
+        storage_confidence = storage_ratio * 0.3  # Storage is weighted at 30%
+        
+        # Factory match adds 10% confidence
+        factory_confidence = 0.1 if factory_match else 0
+        
+        total_confidence = func_confidence + storage_confidence + factory_confidence
+        
+        # Require minimum function matches
+        if function_count < required:
+            total_confidence = 0
+            
+        return min(1.0, total_confidence)
+
+    def identify_oracle(self, address: str) -> OracleIdentificationResult:
+        """
+        Identify oracle protocol for a given contract address.
+        Returns detailed identification result.
+        """
+        if self.cache:
+            cached_result = self.cache.get_result(address, self.patterns_fingerprint)
+            if cached_result:
+                return cached_result
+        
+        result, complete = self._identify_oracle(address)
+        
+        # Failed lookups may succeed later, so only cache clean results
+        if self.cache and complete and result.error is None:
+            self.cache.set_result(address, self.patterns_fingerprint, result)
+        return result
+
+    def _identify_oracle(self, address: str) -> Tuple[OracleIdentificationResult, bool]:
+        """
+        Run the full identification for an address, bypassing the cache.
+        Returns the result and whether every lookup it needed completed.
+        """
+        try:
+            # Get contract bytecode
+            bytecode = self.get_contract_code(address)
+            if not bytecode:
+                return OracleIdentificationResult(
+                    oracle_type=OracleType.UNKNOWN,
+                    address=address,
+                    confidence=0.0,
+                    matched_functions=[],
+                    matched_storage=[],
+                    error="No contract code found"
+                ), True
+
+            best_match = None
+            highest_confidence = 0.0
+            
+            # The deployer is looked up at most once, and only if needed
+            creator = None
+            creator_checked = False
+            creator_failed = False
+            
+            # Match all oracle patterns in a single scan of the bytecode
+            found = self._find_patterns(bytecode)
+
+            # Test against each oracle pattern; only counts are needed here.
+            # A type only replaces the best match with a strictly higher
+            # confidence, so skip work for types that cannot get there.
+            for spec in self._pattern_table:
+                if spec.max_confidence <= highest_confidence:
+                    continue
+                
+                pattern = spec.pattern
+                function_count = sum(1 for p in pattern.function_patterns if p in found)
+                if function_count < spec.required:
+                    continue
+                
+                storage_count = sum(1 for p in pattern.storage_patterns if p in found)
+                confidence = self._score(
+                    function_count,
+                    storage_count,
+                    spec.n_functions,
+                    spec.n_storage,
+                    spec.required,
+                    False
+                )
+                
+                # Check factory match, only if it could still change the outcome
+                factory_match = False
+                if spec.factories and not self.factory_check_available:
+                    factory_match = None
+                elif spec.factories and min(1.0, confidence + 0.1) > highest_confidence:
+                    if not creator_checked:
+                        creator_checked = True
+                        try:
+                            creator = self.get_contract_creator(address)
+                        except Exception as e:
+                            # Score without the factory bonus, but don't cache the result
+                            logger.warning(f"Could not check creator of {address}: {e}")
+                            creator_failed = True
+                    if creator_failed:
+                        factory_match = None
+                    else:
+                        factory_match = creator is not None and creator.lower() in spec.factories
+                    if factory_match:
+                        confidence = self._score(
+                            function_count,
+                            storage_count,
+                            spec.n_functions,
+                            spec.n_storage,
+                            spec.required,
+                            factory_match
+                        )
+                
+                if confidence > highest_confidence:
+                    highest_confidence = confidence
+                    best_match = (spec.oracle_type, pattern, confidence, factory_match)
+
+            if best_match:
+                # Materialize the matched pattern lists for the winner only
+                oracle_type, pattern, confidence, factory_match = best_match
+                return OracleIdentificationResult(
+                    oracle_type=oracle_type,
+                    address=address,
+                    confidence=confidence,
+                    matched_functions=[p for p in pattern.function_patterns if p in found],
+                    matched_storage=[p for p in pattern.storage_patterns if p in found],
+                    factory_match=factory_match
+                ), not creator_failed
+
+            return OracleIdentificationResult(
+                oracle_type=OracleType.UNKNOWN,
+                address=address,
+                confidence=0.0,
+                matched_functions=[],
+                matched_storage=[]
+            ), not creator_failed
+
+        except Exception as e:
+            logger.error(f"Error identifying oracle {address}: {e}")
+            return OracleIdentificationResult(
+                oracle_type=OracleType.UNKNOWN,
+                address=address,
+                confidence=0.0,
+                matched_functions=[],
+                matched_storage=[],
+                error=str(e)
+            ), False
\ No newline at end of file
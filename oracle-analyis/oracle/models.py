@@ -1,5 +1,5 @@
 # oracle_analysis/oracle/models.py
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional, Dict
 
@@ -23,6 +23,13 @@ class OracleType(Enum):
         except ValueError:
             return cls.UNKNOWN
 
+def _decode_hex(value: str) -> Optional[bytes]:
+    """Decode a hex string, returning None if it is not valid hex."""
+    try:
+        return bytes.fromhex(value)
+    except ValueError:
+        return None
+
 @dataclass
 class OraclePattern:
     """Pattern definitions for oracle identification."""
@@ -44,6 +51,21 @@ class OraclePattern:
     # Known factory addresses for this oracle type
     factory_addresses: Optional[List[str]] = None
     
+    # Patterns decoded to raw bytes for matching against bytecode directly
+    function_patterns_bytes: List[bytes] = field(init=False, repr=False)
+    
+    # Entries that are not valid hex can never match bytecode and are None
+    storage_patterns_bytes: List[Optional[bytes]] = field(init=False, repr=False)
+    
+    def __post_init__(self) -> None:
+        """Decode hex patterns once, when the pattern is defined."""
+        self.function_patterns_bytes = [
+            bytes.fromhex(p) for p in self.function_patterns
+        ]
+        self.storage_patterns_bytes = [
+            _decode_hex(p) for p in self.storage_patterns
+        ]
+    
     def to_dict(self) -> Dict:
         """Convert pattern to dictionary format."""
         return {
@@ -79,4 +101,18 @@ class OracleIdentificationResult:
             'factory_match': self.factory_match,
             'error': self.error
         }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'OracleIdentificationResult':
+        """Create result from dictionary format."""
+        return cls(
+            oracle_type=OracleType.from_string(data['type']),
+            address=data['address'],
+            confidence=data['confidence'],
+            matched_functions=data['matched_functions'],
+            matched_storage=data['matched_storage'],
+            creation_match=data.get('creation_match'),
+            factory_match=data.get('factory_match'),
+            error=data.get('error')
+        )
 
@@ -9,8 +9,8 @@ CHAINLINK_PATTERNS = OraclePattern(
         "63668a0f02",  # PUSH4 + latestTimestamp()
         "639a6fc8f5",  # PUSH4 + getRoundData(uint80)
         "63313ce567",  # PUSH4 + decimals()
-        "638ac28d",    # PUSH4 + description()
-        "632fb5c8f",   # PUSH4 + version()
+        "637284e416",  # PUSH4 + description()
+        "6354fd4d50",  # PUSH4 + version()
     ],
     storage_patterns=[
         "54roundId",   # Storage pattern for round ID
@@ -37,9 +37,9 @@ TELLOR_PATTERNS = OraclePattern(
     function_patterns=[
         "63a22cb465",  # PUSH4 + getDataBefore()
         "637584a157",  # PUSH4 + depositStake()
-        "632f1be0c",   # PUSH4 + retrieveData()
+        "6393fa4915",  # PUSH4 + retrieveData(uint256,uint256)
         "63842483d2",  # PUSH4 + getCurrentValue()
-        "635c1f0a0",   # PUSH4 + getNewValueCountbyRequestId()
+        "6346eee1c4",  # PUSH4 + getNewValueCountbyRequestId(uint256)
     ],
     storage_patterns=[
         "54disputeId",
@@ -1,24 +1,62 @@
 # oracle_analysis/utils/__init__.py
 """Utility functions for oracle analysis."""
-from .web3_utils import (
+from .web3utils import (
+    get_session,
+    get_http2_client,
+    PooledHTTPProvider,
     setup_web3,
+    get_chain_id,
     validate_address,
+    fast_is_checksum_address,
+    to_checksum_address,
     get_contract_creation,
     retry_web3_call,
+    single_flight,
+    get_retry_after,
     get_abi_for_address,
+    get_abis_for_addresses,
+    clear_abi_cache,
+    get_contract_creator,
+    get_contract_creators,
     get_block_timestamp,
+    get_block_timestamps,
+    get_latest_block,
+    batch_rpc_request,
     estimate_blocks_per_day,
-    calculate_block_range
+    block_at_timestamp,
+    calculate_block_range,
+    aget_block_timestamp,
+    aget_contract_creation,
+    aget_abi_for_address
 )
 
 __all__ = [
+    'get_session',
+    'get_http2_client',
+    'PooledHTTPProvider',
     'setup_web3',
+    'get_chain_id',
     'validate_address',
+    'fast_is_checksum_address',
+    'to_checksum_address',
     'get_contract_creation',
     'retry_web3_call',
+    'single_flight',
+    'get_retry_after',
     'get_abi_for_address',
+    'get_abis_for_addresses',
+    'clear_abi_cache',
+    'get_contract_creator',
+    'get_contract_creators',
     'get_block_timestamp',
+    'get_block_timestamps',
+    'get_latest_block',
+    'batch_rpc_request',
     'estimate_blocks_per_day',
-    'calculate_block_range'
+    'block_at_timestamp',
+    'calculate_block_range',
+    'aget_block_timestamp',
+    'aget_contract_creation',
+    'aget_abi_for_address'
 ]
 
@@ -1,59 +1,455 @@
 # oracle_analysis/utils/web3_utils.py
+import asyncio
 import logging
+import os
+import random
+import re
+import threading
 import time
-from typing import Any, Optional, Tuple, Callable, Dict
-from functools import wraps
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Optional, Tuple, Callable, Dict, Hashable, Iterable, List
+from functools import lru_cache, partial, wraps
+from pathlib import Path
+from weakref import WeakKeyDictionary
+import orjson
 import requests
-from web3 import Web3
-from web3.exceptions import ContractLogicError, BlockNotFound
-from web3.types import BlockIdentifier
+try:
+    import httpx
+except ImportError:  # httpx is optional; the shared requests session is the fallback
+    httpx = None
+from eth_hash.auto import keccak
+from requests.adapters import HTTPAdapter
+from web3 import HTTPProvider, Web3
+from web3.exceptions import BlockNotFound
+from web3.types import BlockIdentifier, RPCEndpoint, RPCResponse
 
 from ..config import Config
 
 logger = logging.getLogger(__name__)
 
-def setup_web3(provider_url: str) -> Web3:
+ETHERSCAN_API_URL = 'https://api.etherscan.io/api'
+# Most addresses Etherscan's getcontractcreation accepts in one request
+ETHERSCAN_CREATION_BATCH = 5
+
+_HEX_ADDRESS_RE = re.compile(r'0x[0-9a-fA-F]{40}')
+
+# Chain id per Web3 instance, fetched once
+_chain_ids: 'WeakKeyDictionary[Web3, int]' = WeakKeyDictionary()
+_chain_ids_lock = threading.Lock()
+
+# Timestamps of fetched blocks, keyed by (chain id, block number), least recently used first
+_block_timestamps: 'OrderedDict[Tuple[int, int], int]' = OrderedDict()
+_block_timestamps_lock = threading.Lock()
+
+# ABIs by lowercased address: (abi or None for unverified, expiry time or None)
+_abi_cache: Dict[str, Tuple[Optional[Any], Optional[float]]] = {}
+_abi_cache_lock = threading.Lock()
+
+# Worker threads for the async wrappers; bounds concurrent requests to the node
+_executor = ThreadPoolExecutor(max_workers=Config.MAX_WORKERS, thread_name_prefix='web3utils')
+
+class _Flight:
+    """A call in progress whose outcome is shared with concurrent duplicate callers."""
+    
+    def __init__(self):
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+# In-flight calls keyed by (function, call key)
+_inflight: Dict[Tuple[str, Hashable], _Flight] = {}
+_inflight_lock = threading.Lock()
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """
+    Get the process-wide HTTP session.
+    
+    The session keeps connections alive, so RPC and API calls reuse
+    open TCP/TLS connections instead of reconnecting for every request.
+    
+    Returns:
+        Shared requests.Session with a connection pool
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=Config.HTTP_POOL_SIZE,
+        pool_maxsize=Config.HTTP_POOL_SIZE
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+class _RateLimiter:
+    """Thread-safe token bucket allowing `rate` calls per second on average."""
+    
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a call is allowed."""
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            
+            # Reserve a token; callers that overdraw the bucket sleep off the deficit
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+        
+        if wait:
+            time.sleep(wait)
+
+_etherscan_limiter = _RateLimiter(Config.ETHERSCAN_RPS)
+
+def _etherscan_get(params: Dict[str, str]) -> Dict[str, Any]:
+    """
+    Call the Etherscan API over the shared session, within the rate limit.
+    
+    Args:
+        params: Query parameters, without the API key
+        
+    Returns:
+        Decoded JSON response
+        
+    Raises:
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    _etherscan_limiter.acquire()
+    response = get_session().get(
+        ETHERSCAN_API_URL,
+        params=params,
+        timeout=Config.REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+@lru_cache(maxsize=None)
+def get_http2_client() -> Optional['httpx.Client']:
+    """
+    Get the process-wide HTTP/2 client, if httpx with HTTP/2 support is installed.
+    
+    Concurrent requests to the same host are multiplexed over one
+    connection instead of each holding a pooled connection.
+    
+    Returns:
+        Shared httpx.Client, or None if httpx or its h2 extra is missing
+    """
+    if httpx is None:
+        return None
+    try:
+        return httpx.Client(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=Config.HTTP_POOL_SIZE,
+                max_keepalive_connections=Config.HTTP_POOL_SIZE
+            ),
+            timeout=Config.REQUEST_TIMEOUT,
+            follow_redirects=True
+        )
+    except ImportError:
+        logger.info("h2 is not installed, using HTTP/1.1 connections")
+        return None
+
+class PooledHTTPProvider(HTTPProvider):
+    """
+    HTTP provider that sends every request over a shared, long-lived client.
+    
+    Uses the HTTP/2 client when available and the pooled requests session
+    otherwise. Transport errors are always raised as requests exceptions,
+    so retry and rate-limit handling works the same over either client.
+    Request kwargs that httpx cannot take per request (e.g. proxies,
+    verify, cert or a requests auth object) keep the provider on the
+    requests session, where all of them are honored.
+    """
+    
+    # request_kwargs that have an httpx per-request equivalent
+    HTTP2_REQUEST_KWARGS = frozenset({'headers', 'timeout', 'cookies', 'auth'})
+    
+    def __init__(
+        self,
+        endpoint_uri: str,
+        request_kwargs: Optional[Dict[str, Any]] = None,
+        session: Optional[requests.Session] = None,
+        http2: bool = True
+    ):
+        self._session = session if session is not None else get_session()
+        super().__init__(endpoint_uri, request_kwargs=request_kwargs, session=self._session)
+        
+        self.client = get_http2_client() if http2 else None
+        if self.client is not None and not self._http2_compatible(request_kwargs or {}):
+            logger.debug("request_kwargs need the requests session, not using HTTP/2")
+            self.client = None
+    
+    def _http2_compatible(self, request_kwargs: Dict[str, Any]) -> bool:
+        """Check whether every request kwarg can be passed to httpx as is."""
+        if not set(request_kwargs) <= self.HTTP2_REQUEST_KWARGS:
+            return False
+        auth = request_kwargs.get('auth')
+        return auth is None or isinstance(auth, tuple)
+    
+    def post(self, data: bytes) -> bytes:
+        """
+        POST an encoded JSON-RPC payload to the endpoint.
+        
+        Args:
+            data: Encoded request body (a single call or a batch)
+            
+        Returns:
+            Raw response body
+            
+        Raises:
+            requests.exceptions.RequestException: On connection or HTTP errors
+        """
+        request_kwargs = dict(self.get_request_kwargs())
+        request_kwargs.setdefault('timeout', Config.REQUEST_TIMEOUT)
+        
+        if self.client is None:
+            response = self._session.post(self.endpoint_uri, data=data, **request_kwargs)
+            response.raise_for_status()
+            return response.content
+        
+        try:
+            response = self.client.post(self.endpoint_uri, content=data, **request_kwargs)
+        except httpx.TimeoutException as e:
+            raise requests.exceptions.Timeout(str(e)) from e
+        except httpx.TransportError as e:
+            raise requests.exceptions.ConnectionError(str(e)) from e
+        
+        if response.is_error:
+            error_response = requests.Response()
+            error_response.status_code = response.status_code
+            error_response.headers.update(response.headers)
+            error_response.url = str(response.url)
+            error_response._content = response.content
+            raise requests.exceptions.HTTPError(
+                f"{response.status_code} Error for url: {response.url}",
+                response=error_response
+            )
+        return response.content
+    
+    def make_request(self, method: RPCEndpoint, params: Any) -> RPCResponse:
+        return self.decode_rpc_response(self.post(self.encode_rpc_request(method, params)))
+
+def setup_web3(provider_url: str, http2: bool = True) -> Web3:
     """
     Initialize and validate Web3 connection.
     
     Args:
         provider_url: Ethereum node RPC URL
+        http2: Use the HTTP/2 client when httpx is installed
         
     Returns:
-        Configured Web3 instance
+        Configured Web3 instance using a shared HTTP client
         
     Raises:
         ConnectionError: If unable to connect to the provider
     """
-    w3 = Web3(Web3.HTTPProvider(provider_url))
+    w3 = Web3(PooledHTTPProvider(provider_url, http2=http2))
     if not w3.is_connected():
         raise ConnectionError(f"Failed to connect to Ethereum node at {provider_url}")
     return w3
 
-def validate_address(address: str) -> bool:
+def fast_is_checksum_address(address: str) -> bool:
+    """
+    Check that an address is 0x-prefixed hex with a valid EIP-55 checksum.
+    
+    Same result as Web3.is_checksum_address, but hashes with eth_hash's
+    compiled keccak backend and compares nibbles directly instead of
+    building the checksummed string.
+    
+    Args:
+        address: Ethereum address to check
+        
+    Returns:
+        bool: True if the address is checksummed correctly
+    """
+    if not _HEX_ADDRESS_RE.fullmatch(address):
+        return False
+    
+    hex_address = address[2:]
+    digest = keccak(hex_address.lower().encode()).hex()
+    
+    # A letter must be uppercase exactly when its hash nibble is >= 8
+    for char, nibble in zip(hex_address, digest):
+        if char.isalpha() and (int(nibble, 16) >= 8) != char.isupper():
+            return False
+    return True
+
+@lru_cache(maxsize=65536)
+def _is_valid_checksum(address: str) -> bool:
+    """Check address format and EIP-55 checksum, memoized per address."""
+    return fast_is_checksum_address(address)
+
+def get_chain_id(w3: Web3) -> int:
+    """
+    Get the chain id of a Web3 instance, querying the node only once.
+    
+    Args:
+        w3: Web3 instance
+        
+    Returns:
+        Chain id
+    """
+    with _chain_ids_lock:
+        chain_id = _chain_ids.get(w3)
+    
+    if chain_id is None:
+        chain_id = w3.eth.chain_id
+        with _chain_ids_lock:
+            _chain_ids[w3] = chain_id
+    
+    return chain_id
+
+def validate_address(address: str, strict: bool = True) -> bool:
     """
     Validate Ethereum address format.
     
     Args:
         address: Ethereum address to validate
+        strict: Also require a valid EIP-55 checksum; when False only the
+            0x-prefixed 40 hex digit format is checked
         
     Returns:
         bool: True if address is valid
     """
-    try:
-        return Web3.is_address(address) and Web3.is_checksum_address(address)
-    except ValueError:
+    if not strict:
+        return isinstance(address, str) and _HEX_ADDRESS_RE.fullmatch(address) is not None
+    if not isinstance(address, str):
         return False
+    return _is_valid_checksum(address)
+
+@lru_cache(maxsize=65536)
+def to_checksum_address(address: str) -> str:
+    """
+    Convert an address to its EIP-55 checksum form, with memoization.
+    
+    The conversion hashes the address with keccak256; oracle and token
+    addresses repeat across markets, so each one is only hashed once.
+    
+    Args:
+        address: Ethereum address in any letter case
+        
+    Returns:
+        Checksummed address
+    """
+    return Web3.to_checksum_address(address)
+
+def get_retry_after(error: Exception) -> Optional[float]:
+    """
+    Get the delay requested by a rate-limited (HTTP 429) response.
+    
+    Args:
+        error: Exception raised by a request
+        
+    Returns:
+        Seconds from the Retry-After header, or None if the error is not a
+        429 response or carries no numeric Retry-After value
+    """
+    response = getattr(error, 'response', None)
+    if response is None or response.status_code != 429:
+        return None
+    
+    try:
+        return max(0.0, float(response.headers['Retry-After']))
+    except (KeyError, TypeError, ValueError):
+        return None
+
+def single_flight(key: Callable[..., Hashable]):
+    """
+    Decorator that coalesces concurrent identical calls into one.
+    
+    While a call is running, other threads calling with the same key wait
+    for it and receive its result or exception instead of making their own
+    request. Nothing is cached once the call returns.
+    
+    Args:
+        key: Function mapping the call's arguments to a hashable key
+        
+    Returns:
+        Decorator function
+    """
+    def decorator(func: Callable):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            flight_key = (func.__qualname__, key(*args, **kwargs))
+            
+            with _inflight_lock:
+                flight = _inflight.get(flight_key)
+                leader = flight is None
+                if leader:
+                    flight = _inflight[flight_key] = _Flight()
+            
+            if not leader:
+                flight.done.wait()
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+            
+            try:
+                flight.result = func(*args, **kwargs)
+                return flight.result
+            except BaseException as e:
+                flight.error = e
+                raise
+            finally:
+                with _inflight_lock:
+                    del _inflight[flight_key]
+                flight.done.set()
+        return wrapper
+    return decorator
+
+def _retry_delay(error: Exception, current_delay: float) -> Optional[float]:
+    """
+    Decide how long to wait before retrying a failed call.
+    
+    Args:
+        error: Exception raised by the call
+        current_delay: Backoff delay for this attempt
+        
+    Returns:
+        Seconds to wait, or None if the error is permanent or the server asks
+        for a longer wait than max(current_delay, Config.REQUEST_TIMEOUT)
+    """
+    response = getattr(error, 'response', None)
+    status = getattr(response, 'status_code', None)
+    
+    if status == 429:
+        retry_after = get_retry_after(error)
+        if retry_after is None:
+            return current_delay
+        
+        # Don't park a worker thread for minutes or hours; surface the 429 instead
+        max_wait = max(current_delay, Config.REQUEST_TIMEOUT)
+        if retry_after > max_wait:
+            logger.warning("Retry-After of %.0fs exceeds the %.0fs limit, not retrying", retry_after, max_wait)
+            return None
+        return retry_after
+    if status is not None and 400 <= status < 500:
+        return None
+    if status is not None and status >= 500:
+        # Spread out retries from concurrent callers hitting the same outage
+        return current_delay + random.uniform(0, current_delay * 0.25)
+    return current_delay
 
 def retry_web3_call(
     max_retries: int = 3,
     delay: float = 1.0,
     backoff: float = 2.0,
-    exceptions: tuple = (ContractLogicError, BlockNotFound, requests.exceptions.RequestException)
+    exceptions: tuple = (BlockNotFound, requests.exceptions.RequestException)
 ):
     """
     Decorator for retrying Web3 calls with exponential backoff.
     
+    HTTP 4xx errors other than 429 are raised immediately. A 429 waits for
+    its Retry-After header when present, and 5xx errors back off with jitter.
+    Coroutine functions get an async wrapper that waits with asyncio.sleep,
+    so retries never block the event loop.
+    
     Args:
         max_retries: Maximum number of retry attempts
         delay: Initial delay between retries in seconds
@@ -64,6 +460,39 @@ def retry_web3_call(
         Decorator function
     """
     def decorator(func: Callable):
+        def next_wait(e: Exception, retries: int, current_delay: float) -> float:
+            """Return the wait before the next attempt, or re-raise if there is none."""
+            wait = _retry_delay(e, current_delay)
+            if wait is None:
+                raise e
+            
+            if retries == max_retries:
+                logger.error("Max retries (%d) reached for %s", max_retries, func.__name__)
+                raise e
+            
+            logger.warning(
+                "Retry %d/%d for %s in %.1fs after error: %s",
+                retries + 1, max_retries, func.__name__, wait, e
+            )
+            return wait
+        
+        if asyncio.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                retries = 0
+                current_delay = delay
+                
+                while retries <= max_retries:
+                    try:
+                        return await func(*args, **kwargs)
+                    except exceptions as e:
+                        await asyncio.sleep(next_wait(e, retries, current_delay))
+                        retries += 1
+                        current_delay *= backoff
+                
+                return None
+            return async_wrapper
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
             retries = 0
@@ -73,55 +502,170 @@ def retry_web3_call(
                 try:
                     return func(*args, **kwargs)
                 except exceptions as e:
-                    if retries == max_retries:
-                        logger.error(f"Max retries ({max_retries}) reached for {func.__name__}")
-                        raise
-                        
+                    time.sleep(next_wait(e, retries, current_delay))
                     retries += 1
-                    logger.warning(
-                        f"Retry {retries}/{max_retries} for {func.__name__} "
-                        f"after error: {str(e)}"
-                    )
-                    
-                    time.sleep(current_delay)
                     current_delay *= backoff
             
             return None
         return wrapper
     return decorator
 
+def _get_creation_record(
+    contract_address: str,
+    etherscan_api_key: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up a contract's deployment in Etherscan's contract creation index.
+    
+    Args:
+        contract_address: Contract address
+        etherscan_api_key: Etherscan API key (default: Config.ETHERSCAN_API_KEY)
+        
+    Returns:
+        Etherscan record with contractCreator and txHash, or None if
+        Etherscan has no record for the address
+        
+    Raises:
+        ValueError: If no API key is configured or Etherscan answers with an
+            error (e.g. rate limiting) instead of a definite result
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    etherscan_api_key = etherscan_api_key or Config.ETHERSCAN_API_KEY
+    if not etherscan_api_key:
+        raise ValueError("No Etherscan API key provided")
+    
+    result = _etherscan_get({
+        'module': 'contract',
+        'action': 'getcontractcreation',
+        'contractaddresses': contract_address,
+        'apikey': etherscan_api_key
+    })
+    
+    if result['status'] == '1' and result['result']:
+        return result['result'][0]
+    if result['status'] == '1' or result.get('message') == 'No data found':
+        logger.debug("No creation record found for %s", contract_address)
+        return None
+    
+    raise ValueError(f"Etherscan getcontractcreation failed: {result.get('result')}")
+
 @retry_web3_call()
 def get_contract_creation(
     w3: Web3,
-    contract_address: str
+    contract_address: str,
+    include_creation_code: bool = False,
+    etherscan_api_key: Optional[str] = None
 ) -> Optional[Dict[str, Any]]:
     """
     Get contract creation transaction details.
     
+    The creator and creation tx come from Etherscan's contract creation
+    index in one request; the transaction itself is only fetched from the
+    node when the creation code is requested or Etherscan omits the block.
+    
     Args:
         w3: Web3 instance
         contract_address: Contract address to check
+        include_creation_code: Also return the creation transaction's input
+        etherscan_api_key: Etherscan API key (optional)
         
     Returns:
-        Dict containing creation transaction details or None
+        Dict containing creation transaction details, or None if there is no
+        API key or no creation record
+        
+    Raises:
+        ValueError: If Etherscan answers with an error such as rate limiting
     """
     # Convert to checksum address
-    contract_address = Web3.to_checksum_address(contract_address)
-    
-    # Get the earliest transaction for this address
-    block = w3.eth.get_block('latest')
-    for tx_hash in block['transactions']:
-        tx = w3.eth.get_transaction(tx_hash)
-        if tx['to'] is None and tx['creates'] == contract_address:
-            return {
-                'creator': tx['from'],
-                'creation_tx': tx_hash.hex(),
-                'block_number': tx['blockNumber'],
-                'creation_code': tx['input']
-            }
-    
-    return None
+    contract_address = to_checksum_address(contract_address)
+    
+    if not (etherscan_api_key or Config.ETHERSCAN_API_KEY):
+        logger.debug("No Etherscan API key provided")
+        return None
+    
+    record = _get_creation_record(contract_address, etherscan_api_key)
+    if record is None:
+        return None
+    
+    creation = {
+        'creator': to_checksum_address(record['contractCreator']),
+        'creation_tx': record['txHash'],
+        'block_number': int(record['blockNumber']) if record.get('blockNumber') else None
+    }
+    
+    if include_creation_code or creation['block_number'] is None:
+        tx = w3.eth.get_transaction(record['txHash'])
+        creation['block_number'] = tx['blockNumber']
+        if include_creation_code:
+            creation['creation_code'] = tx['input']
+    
+    return creation
+
+def _abi_cache_path(address: str) -> Path:
+    """Path of the on-disk cache file for a lowercased address."""
+    return Path(Config.ABI_CACHE_DIR) / f"{address}.json"
 
+def _load_cached_abi(address: str) -> Tuple[bool, Optional[Any]]:
+    """
+    Look up an ABI in memory, then on disk.
+    
+    Args:
+        address: Lowercased contract address
+        
+    Returns:
+        Tuple of (hit, abi); abi is None for a cached "not verified" answer
+    """
+    now = time.time()
+    with _abi_cache_lock:
+        entry = _abi_cache.get(address)
+    
+    if entry is None:
+        try:
+            data = orjson.loads(_abi_cache_path(address).read_bytes())
+            entry = (data['abi'], data['expires'])
+        except (OSError, ValueError, KeyError):
+            return False, None
+        with _abi_cache_lock:
+            _abi_cache[address] = entry
+    
+    abi, expires = entry
+    if expires is not None and expires <= now:
+        return False, None
+    return True, abi
+
+def _store_abi(address: str, abi: Optional[Any]) -> None:
+    """
+    Cache an ABI forever, or a "not verified" answer for Config.ABI_NEGATIVE_TTL.
+    
+    Args:
+        address: Lowercased contract address
+        abi: ABI returned by Etherscan, or None if the contract is not verified
+    """
+    expires = None if abi is not None else time.time() + Config.ABI_NEGATIVE_TTL
+    with _abi_cache_lock:
+        _abi_cache[address] = (abi, expires)
+    
+    path = _abi_cache_path(address)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp_path.write_bytes(orjson.dumps({'abi': abi, 'expires': expires}))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write ABI cache for %s: %s", address, e)
+
+def clear_abi_cache() -> None:
+    """Drop all cached ABIs, in memory and on disk."""
+    with _abi_cache_lock:
+        _abi_cache.clear()
+    
+    for path in Path(Config.ABI_CACHE_DIR).glob('*.json'):
+        try:
+            path.unlink()
+        except OSError as e:
+            logger.warning("Could not remove %s: %s", path, e)
+
+@single_flight(key=lambda contract_address, etherscan_api_key=None: contract_address.lower())
 @retry_web3_call()
 def get_abi_for_address(
     contract_address: str,
@@ -130,6 +674,10 @@ def get_abi_for_address(
     """
     Fetch contract ABI from Etherscan.
     
+    ABIs are cached in memory and as JSON files under Config.ABI_CACHE_DIR.
+    Verified ABIs never expire; "not verified" answers expire after
+    Config.ABI_NEGATIVE_TTL seconds. Failed requests are not cached.
+    
     Args:
         contract_address: Contract address
         etherscan_api_key: Etherscan API key (optional)
@@ -137,6 +685,11 @@ def get_abi_for_address(
     Returns:
         Contract ABI as list or None if not found
     """
+    cache_key = contract_address.lower()
+    hit, abi = _load_cached_abi(cache_key)
+    if hit:
+        return abi
+    
     if not etherscan_api_key:
         etherscan_api_key = Config.ETHERSCAN_API_KEY
         
@@ -144,34 +697,158 @@ def get_abi_for_address(
         logger.warning("No Etherscan API key provided")
         return None
         
-    url = (
-        f"https://api.etherscan.io/api"
-        f"?module=contract"
-        f"&action=getabi"
-        f"&address={contract_address}"
-        f"&apikey={etherscan_api_key}"
-    )
-    
     try:
-        response = requests.get(url)
-        response.raise_for_status()
-        result = response.json()
+        result = _etherscan_get({
+            'module': 'contract',
+            'action': 'getabi',
+            'address': contract_address,
+            'apikey': etherscan_api_key
+        })
         
         if result['status'] == '1' and result['message'] == 'OK':
+            _store_abi(cache_key, result['result'])
             return result['result']
         else:
-            logger.warning(f"No verified contract found for {contract_address}")
+            logger.warning("No verified contract found for %s", contract_address)
+            # Only cache a definite "not verified"; rate-limit and other NOTOK answers are transient
+            if 'not verified' in str(result.get('result', '')).lower():
+                _store_abi(cache_key, None)
             return None
             
     except Exception as e:
-        logger.error(f"Error fetching ABI for {contract_address}: {e}")
+        logger.error("Error fetching ABI for %s: %s", contract_address, e)
         return None
 
+def get_contract_creator(
+    contract_address: str,
+    etherscan_api_key: Optional[str] = None
+) -> Optional[str]:
+    """
+    Fetch the address that deployed a contract from Etherscan.
+    
+    Args:
+        contract_address: Contract address
+        etherscan_api_key: Etherscan API key (optional)
+        
+    Returns:
+        Creator address, or None if Etherscan has no creation record
+        
+    Raises:
+        ValueError: If no API key is configured or Etherscan answers with an error
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    record = _get_creation_record(contract_address, etherscan_api_key)
+    return record['contractCreator'] if record else None
+
+def get_abis_for_addresses(
+    addresses: Iterable[str],
+    etherscan_api_key: Optional[str] = None
+) -> Dict[str, Optional[list]]:
+    """
+    Fetch ABIs for many contracts concurrently.
+    
+    Cached ABIs are returned without a request. The rest are fetched in
+    parallel on a dedicated thread pool; the shared Etherscan rate limiter paces
+    them, since getabi/getsourcecode only accept one address per call.
+    
+    Args:
+        addresses: Contract addresses (duplicates are ignored)
+        etherscan_api_key: Etherscan API key (optional)
+        
+    Returns:
+        Dict mapping each address to its ABI, or None if not found
+    """
+    abis: Dict[str, Optional[list]] = {}
+    missing = []
+    for address in dict.fromkeys(addresses):
+        hit, abi = _load_cached_abi(address.lower())
+        if hit:
+            abis[address] = abi
+        else:
+            missing.append(address)
+    
+    if not missing:
+        return abis
+    
+    # A local pool, so blocking on it from a module worker thread cannot deadlock
+    with ThreadPoolExecutor(max_workers=min(Config.MAX_WORKERS, len(missing))) as executor:
+        futures = {
+            address: executor.submit(get_abi_for_address, address, etherscan_api_key)
+            for address in missing
+        }
+        for address, future in futures.items():
+            abis[address] = future.result()
+    
+    return abis
+
+def get_contract_creators(
+    addresses: Iterable[str],
+    etherscan_api_key: Optional[str] = None
+) -> Dict[str, Optional[str]]:
+    """
+    Fetch the deployers of many contracts, several addresses per Etherscan request.
+    
+    Args:
+        addresses: Contract addresses (duplicates are ignored)
+        etherscan_api_key: Etherscan API key (optional)
+        
+    Returns:
+        Dict mapping each address to its creator, or None if Etherscan has
+        no creation record for it
+        
+    Raises:
+        ValueError: If no API key is configured or Etherscan answers a chunk
+            with an error (e.g. rate limiting) instead of a definite result
+        requests.exceptions.RequestException: On connection or HTTP errors
+    """
+    addresses = list(dict.fromkeys(addresses))
+    creators: Dict[str, Optional[str]] = dict.fromkeys(addresses)
+    
+    etherscan_api_key = etherscan_api_key or Config.ETHERSCAN_API_KEY
+    if not etherscan_api_key:
+        raise ValueError("No Etherscan API key provided")
+    
+    by_lower = {address.lower(): address for address in addresses}
+    for offset in range(0, len(addresses), ETHERSCAN_CREATION_BATCH):
+        chunk = addresses[offset:offset + ETHERSCAN_CREATION_BATCH]
+        result = _etherscan_get({
+            'module': 'contract',
+            'action': 'getcontractcreation',
+            'contractaddresses': ','.join(chunk),
+            'apikey': etherscan_api_key
+        })
+        
+        if result['status'] != '1' or not result['result']:
+            if result['status'] == '1' or result.get('message') == 'No data found':
+                logger.debug("No creation records found for %s", ', '.join(chunk))
+                continue
+            raise ValueError(f"Etherscan getcontractcreation failed: {result.get('result')}")
+        for record in result['result']:
+            address = by_lower.get(record['contractAddress'].lower())
+            if address is not None:
+                creators[address] = record['contractCreator']
+    
+    return creators
+
+def _cache_block_timestamp(w3: Web3, block_number: int, timestamp: int) -> None:
+    """Store a block's timestamp in the LRU cache, evicting the oldest entry if full."""
+    key = (get_chain_id(w3), block_number)
+    with _block_timestamps_lock:
+        _block_timestamps[key] = timestamp
+        _block_timestamps.move_to_end(key)
+        if len(_block_timestamps) > Config.BLOCK_CACHE_SIZE:
+            _block_timestamps.popitem(last=False)
+
+@single_flight(key=lambda w3, block_identifier: (id(w3), str(block_identifier)))
 @retry_web3_call()
 def get_block_timestamp(w3: Web3, block_identifier: BlockIdentifier) -> int:
     """
     Get timestamp for a specific block.
     
+    Timestamps looked up by block number are kept in a bounded LRU cache
+    (Config.BLOCK_CACHE_SIZE entries). Tags such as 'latest' and block
+    hashes always go to the node.
+    
     Args:
         w3: Web3 instance
         block_identifier: Block number or hash
@@ -179,8 +856,131 @@ def get_block_timestamp(w3: Web3, block_identifier: BlockIdentifier) -> int:
     Returns:
         Block timestamp as Unix timestamp
     """
-    block = w3.eth.get_block(block_identifier)
-    return block['timestamp']
+    if not isinstance(block_identifier, int):
+        return w3.eth.get_block(block_identifier, full_transactions=False)['timestamp']
+    
+    key = (get_chain_id(w3), block_identifier)
+    with _block_timestamps_lock:
+        if key in _block_timestamps:
+            _block_timestamps.move_to_end(key)
+            return _block_timestamps[key]
+    
+    timestamp = w3.eth.get_block(block_identifier, full_transactions=False)['timestamp']
+    _cache_block_timestamp(w3, block_identifier, timestamp)
+    
+    return timestamp
+
+@retry_web3_call()
+def get_latest_block(w3: Web3) -> Tuple[int, int]:
+    """
+    Get the number and timestamp of the latest block in a single request.
+    
+    The timestamp is added to the block timestamp cache.
+    
+    Args:
+        w3: Web3 instance
+        
+    Returns:
+        Tuple of (block_number, timestamp)
+    """
+    block = w3.eth.get_block('latest', full_transactions=False)
+    _cache_block_timestamp(w3, block['number'], block['timestamp'])
+    return block['number'], block['timestamp']
+
+def batch_rpc_request(
+    w3: Web3,
+    method: str,
+    params_list: List[list],
+    batch_size: Optional[int] = None
+) -> List[Any]:
+    """
+    Send many calls of one JSON-RPC method as batched HTTP requests.
+    
+    Args:
+        w3: Web3 instance backed by an HTTP provider
+        method: JSON-RPC method name, e.g. 'eth_getBlockByNumber'
+        params_list: Parameters for each individual call
+        batch_size: Maximum calls per HTTP request (default: Config.RPC_BATCH_SIZE)
+        
+    Returns:
+        List of results in the same order as params_list
+        
+    Raises:
+        ValueError: If the node rejects the batch or any call in it, or the
+            response does not answer exactly the calls that were sent
+    """
+    batch_size = batch_size if batch_size is not None else Config.RPC_BATCH_SIZE
+    results = []
+    
+    for offset in range(0, len(params_list), batch_size):
+        chunk = params_list[offset:offset + batch_size]
+        payload = [
+            {'jsonrpc': '2.0', 'id': i, 'method': method, 'params': params}
+            for i, params in enumerate(chunk)
+        ]
+        
+        if isinstance(w3.provider, PooledHTTPProvider):
+            content = w3.provider.post(orjson.dumps(payload))
+        else:
+            response = get_session().post(
+                w3.provider.endpoint_uri,
+                data=orjson.dumps(payload),
+                headers={'Content-Type': 'application/json'},
+                timeout=Config.REQUEST_TIMEOUT
+            )
+            response.raise_for_status()
+            content = response.content
+        responses = orjson.loads(content)
+        
+        # Providers without batch support answer with a single error object
+        if not isinstance(responses, list):
+            raise ValueError(f"Batch request for {method} rejected: {responses}")
+        
+        # Responses may arrive in any order, so match them to calls by id
+        by_id = {}
+        for item in responses:
+            if not isinstance(item, dict):
+                raise ValueError(f"Malformed {method} response: {item}")
+            if 'error' in item:
+                raise ValueError(f"{method} failed: {item['error']}")
+            
+            item_id = item.get('id')
+            if not isinstance(item_id, int) or not 0 <= item_id < len(chunk) or item_id in by_id:
+                raise ValueError(f"Unexpected id {item_id!r} in {method} batch response")
+            by_id[item_id] = item['result']
+        
+        if len(by_id) != len(chunk):
+            missing = sorted(set(range(len(chunk))) - by_id.keys())
+            raise ValueError(f"{method} batch response is missing ids {missing}")
+        
+        results.extend(by_id[i] for i in range(len(chunk)))
+    
+    return results
+
+@retry_web3_call()
+def get_block_timestamps(w3: Web3, block_numbers: Iterable[int]) -> Dict[int, int]:
+    """
+    Get timestamps for many blocks using batched JSON-RPC requests.
+    
+    Args:
+        w3: Web3 instance
+        block_numbers: Block numbers to look up (duplicates are ignored)
+        
+    Returns:
+        Dict mapping block number to Unix timestamp
+    """
+    block_numbers = sorted(set(block_numbers))
+    blocks = batch_rpc_request(
+        w3,
+        'eth_getBlockByNumber',
+        [[hex(number), False] for number in block_numbers]
+    )
+    
+    return {
+        number: int(block['timestamp'], 16)
+        for number, block in zip(block_numbers, blocks)
+        if block
+    }
 
 def estimate_blocks_per_day(w3: Web3, sample_size: int = 1000) -> float:
     """
@@ -193,17 +993,47 @@ def estimate_blocks_per_day(w3: Web3, sample_size: int = 1000) -> float:
     Returns:
         Estimated blocks per day
     """
-    latest_block = w3.eth.block_number
-    start_block = latest_block - sample_size
-    
-    start_time = get_block_timestamp(w3, start_block)
-    end_time = get_block_timestamp(w3, latest_block)
+    # One header read gives both the latest number and its timestamp
+    latest_block, end_time = get_latest_block(w3)
+    start_time = get_block_timestamp(w3, latest_block - sample_size)
     
     time_diff = end_time - start_time  # in seconds
     blocks_per_day = (sample_size / time_diff) * 86400  # 86400 seconds in a day
     
     return blocks_per_day
 
+def block_at_timestamp(
+    w3: Web3,
+    timestamp: int,
+    high: Optional[int] = None
+) -> int:
+    """
+    Find the first block mined at or after a timestamp.
+    
+    Binary search over block numbers, so it needs about log2(high) timestamp
+    lookups; repeated probes are served by the block timestamp cache.
+    
+    Args:
+        w3: Web3 instance
+        timestamp: Unix timestamp to search for
+        high: Highest block to consider (default: latest block)
+        
+    Returns:
+        Block number, or high if every block is older than timestamp
+    """
+    low = 0
+    if high is None:
+        high = w3.eth.block_number
+    
+    while low < high:
+        mid = (low + high) // 2
+        if get_block_timestamp(w3, mid) < timestamp:
+            low = mid + 1
+        else:
+            high = mid
+    
+    return low
+
 def calculate_block_range(
     w3: Web3,
     days_ago: float
@@ -218,10 +1048,68 @@ def calculate_block_range(
     Returns:
         Tuple of (start_block, end_block)
     """
-    blocks_per_day = estimate_blocks_per_day(w3)
-    blocks_to_search = int(blocks_per_day * days_ago)
+    end_block, end_time = get_latest_block(w3)
+    
+    start_block = block_at_timestamp(w3, end_time - int(days_ago * 86400), high=end_block)
     
-    end_block = w3.eth.block_number
-    start_block = max(0, end_block - blocks_to_search)
+    return start_block, end_block
+
+async def _run_blocking(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking helper on the module's worker pool and await the result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_executor, partial(func, *args, **kwargs))
+
+async def aget_block_timestamp(w3: Web3, block_identifier: BlockIdentifier) -> int:
+    """
+    Async variant of get_block_timestamp that does not block the event loop.
     
-    return start_block, end_block
\ No newline at end of file
+    Args:
+        w3: Web3 instance
+        block_identifier: Block number or hash
+        
+    Returns:
+        Block timestamp as Unix timestamp
+    """
+    return await _run_blocking(get_block_timestamp, w3, block_identifier)
+
+async def aget_contract_creation(
+    w3: Web3,
+    contract_address: str,
+    include_creation_code: bool = False,
+    etherscan_api_key: Optional[str] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Async variant of get_contract_creation that does not block the event loop.
+    
+    Args:
+        w3: Web3 instance
+        contract_address: Contract address to check
+        include_creation_code: Also return the creation transaction's input
+        etherscan_api_key: Etherscan API key (optional)
+        
+    Returns:
+        Dict containing creation transaction details or None
+    """
+    return await _run_blocking(
+        get_contract_creation,
+        w3,
+        contract_address,
+        include_creation_code,
+        etherscan_api_key
+    )
+
+async def aget_abi_for_address(
+    contract_address: str,
+    etherscan_api_key: Optional[str] = None
+) -> Optional[list]:
+    """
+    Async variant of get_abi_for_address that does not block the event loop.
+    
+    Args:
+        contract_address: Contract address
+        etherscan_api_key: Etherscan API key (optional)
+        
+    Returns:
+        Contract ABI as list or None if not found
+    """
+    return await _run_blocking(get_abi_for_address, contract_address, etherscan_api_key)
@@ -9,6 +9,10 @@ setup(
         "python-dotenv>=1.0.0",
         "pandas>=2.1.1",
         "tqdm>=4.66.1",
+        "orjson>=3.9.10",
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.25.2"],
+    },
     python_requires=">=3.8",
 )
\ No newline at end of file
@@ -0,0 +1,17 @@
+# tests/conftest.py
+"""Make the oracle-analyis source directory importable as the oracle_analysis package."""
+import importlib.util
+import sys
+from pathlib import Path
+
+PACKAGE_DIR = Path(__file__).resolve().parent.parent / 'oracle-analyis'
+
+if 'oracle_analysis' not in sys.modules:
+    spec = importlib.util.spec_from_file_location(
+        'oracle_analysis',
+        PACKAGE_DIR / '__init__.py',
+        submodule_search_locations=[str(PACKAGE_DIR)]
+    )
+    module = importlib.util.module_from_spec(spec)
+    sys.modules['oracle_analysis'] = module
+    spec.loader.exec_module(module)
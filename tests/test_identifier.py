@@ -0,0 +1,164 @@
+# tests/test_identifier.py
+"""Compare OracleIdentifier against an exhaustive scorer on random bytecode."""
+import random
+from types import SimpleNamespace
+
+import logging
+
+import pytest
+
+from oracle_analysis.config import Config
+from oracle_analysis.oracle import identifier
+from oracle_analysis.oracle.cache import OracleCache
+from oracle_analysis.oracle.models import OraclePattern, OracleType
+
+ADDRESS = '0x' + '11' * 20
+FACTORY = '0x47Fb2585D2C56Fe188D0E6ec628a38b74fCeeeDf'
+OTHER_CREATOR = '0x' + '22' * 20
+
+
+@pytest.fixture(autouse=True)
+def etherscan_api_key(monkeypatch):
+    monkeypatch.setattr(Config, 'ETHERSCAN_API_KEY', 'key')
+
+
+def make_identifier(monkeypatch, code, creator, regex=True, cache=None):
+    """Identifier over a stub chain whose only contract has the given code and deployer."""
+    w3 = SimpleNamespace(eth=SimpleNamespace(get_code=lambda address: code))
+    creator_lookups = []
+
+    def get_contract_creator(address):
+        creator_lookups.append(address)
+        return creator
+
+    monkeypatch.setattr(identifier, 'get_contract_creator', get_contract_creator)
+    oracle_identifier = identifier.OracleIdentifier(w3, cache)
+    if not regex:
+        oracle_identifier._pattern_regex = None
+    return oracle_identifier, creator_lookups
+
+
+def exhaustive_identify(oracle_identifier, code, creator):
+    """Score every oracle type in full and keep the first with the highest confidence."""
+    best, highest = None, 0.0
+    for oracle_type, pattern in oracle_identifier.patterns.items():
+        functions, storage = oracle_identifier.analyze_code_patterns(code, pattern)
+        factory_match = creator is not None and creator.lower() in {
+            a.lower() for a in pattern.factory_addresses or []
+        }
+        confidence = oracle_identifier.calculate_confidence(functions, storage, pattern, factory_match)
+        if confidence > highest:
+            best, highest = (oracle_type, confidence, functions, storage, factory_match), confidence
+    return best
+
+
+def random_code(rng, patterns):
+    """Bytecode holding a random subset of the given patterns, in random order."""
+    chosen = rng.sample(patterns, rng.randint(0, len(patterns)))
+    return b'\x00'.join([b'\x60\x80'] + chosen)
+
+
+def share_tellor_patterns(monkeypatch):
+    """Give Uniswap and Pyth the same patterns as Tellor, so their scores always tie."""
+    for name in ('UNISWAP_PATTERNS', 'PYTH_PATTERNS'):
+        tellor = identifier.TELLOR_PATTERNS
+        monkeypatch.setattr(identifier, name, OraclePattern(
+            function_patterns=list(tellor.function_patterns),
+            storage_patterns=list(tellor.storage_patterns),
+            required_function_matches=tellor.required_function_matches
+        ))
+
+
+@pytest.mark.parametrize('regex', [True, False], ids=['regex', 'fallback'])
+@pytest.mark.parametrize('tied', [False, True], ids=['patterns', 'tied-patterns'])
+def test_identify_matches_exhaustive_scoring(monkeypatch, regex, tied):
+    if tied:
+        share_tellor_patterns(monkeypatch)
+    rng = random.Random(5)
+    patterns = list(identifier.OracleIdentifier(None)._patterns_by_bytes)
+
+    for _ in range(300):
+        code = random_code(rng, patterns)
+        creator = rng.choice([FACTORY, FACTORY.lower(), OTHER_CREATOR, None])
+        oracle_identifier, creator_lookups = make_identifier(monkeypatch, code, creator, regex)
+        assert (oracle_identifier._pattern_regex is not None) == regex
+
+        result = oracle_identifier.identify_oracle(ADDRESS)
+        expected = exhaustive_identify(oracle_identifier, code, creator)
+
+        assert len(creator_lookups) <= 1
+        if expected is None:
+            assert result.oracle_type == OracleType.UNKNOWN
+            assert result.confidence == 0.0
+        else:
+            assert (
+                result.oracle_type,
+                result.confidence,
+                result.matched_functions,
+                result.matched_storage,
+                result.factory_match
+            ) == expected
+
+
+@pytest.mark.parametrize('regex', [True, False], ids=['regex', 'fallback'])
+def test_ties_keep_declaration_order(monkeypatch, regex):
+    share_tellor_patterns(monkeypatch)
+    code = b'\x00'.join(bytes.fromhex(p) for p in identifier.TELLOR_PATTERNS.function_patterns)
+    oracle_identifier, _ = make_identifier(monkeypatch, code, None, regex)
+
+    assert oracle_identifier.identify_oracle(ADDRESS).oracle_type == OracleType.TELLOR
+
+
+@pytest.mark.parametrize('regex', [True, False], ids=['regex', 'fallback'])
+def test_factory_bonus(monkeypatch, regex):
+    chainlink = identifier.CHAINLINK_PATTERNS
+    code = b'\x00'.join(bytes.fromhex(p) for p in chainlink.function_patterns)
+
+    oracle_identifier, creator_lookups = make_identifier(monkeypatch, code, FACTORY, regex)
+    with_factory = oracle_identifier.identify_oracle(ADDRESS)
+    oracle_identifier, _ = make_identifier(monkeypatch, code, OTHER_CREATOR, regex)
+    without_factory = oracle_identifier.identify_oracle(ADDRESS)
+
+    assert creator_lookups == [ADDRESS]
+    assert with_factory.oracle_type == OracleType.CHAINLINK
+    assert with_factory.factory_match is True
+    assert without_factory.factory_match is False
+    assert with_factory.confidence == pytest.approx(min(1.0, without_factory.confidence + 0.1))
+
+
+def test_without_api_key_factory_match_is_unknown(monkeypatch, tmp_path, caplog):
+    monkeypatch.setattr(Config, 'ETHERSCAN_API_KEY', None)
+    code = b'\x00'.join(bytes.fromhex(p) for p in identifier.CHAINLINK_PATTERNS.function_patterns)
+    cache = OracleCache(str(tmp_path / 'cache.db'))
+    oracle_identifier, creator_lookups = make_identifier(monkeypatch, code, FACTORY, cache=cache)
+
+    with caplog.at_level(logging.WARNING):
+        result = oracle_identifier.identify_oracle(ADDRESS)
+
+    assert creator_lookups == []
+    assert result.oracle_type == OracleType.CHAINLINK
+    assert result.factory_match is None
+    assert not caplog.records
+    assert cache.get_result(ADDRESS, oracle_identifier.patterns_fingerprint) == result
+
+    # Results scored without the factory check are redone once a key is configured
+    monkeypatch.setattr(Config, 'ETHERSCAN_API_KEY', 'key')
+    oracle_identifier, creator_lookups = make_identifier(monkeypatch, code, FACTORY, cache=cache)
+    assert oracle_identifier.identify_oracle(ADDRESS).factory_match is True
+    assert creator_lookups == [ADDRESS]
+
+
+def test_failed_creator_lookup_is_not_cached(monkeypatch, tmp_path):
+    code = b'\x00'.join(bytes.fromhex(p) for p in identifier.CHAINLINK_PATTERNS.function_patterns)
+    cache = OracleCache(str(tmp_path / 'cache.db'))
+    oracle_identifier, _ = make_identifier(monkeypatch, code, FACTORY, cache=cache)
+
+    def get_contract_creator(address):
+        raise ValueError('Max rate limit reached')
+
+    monkeypatch.setattr(identifier, 'get_contract_creator', get_contract_creator)
+    result = oracle_identifier.identify_oracle(ADDRESS)
+
+    assert result.oracle_type == OracleType.CHAINLINK
+    assert result.factory_match is None
+    assert cache.get_result(ADDRESS, oracle_identifier.patterns_fingerprint) is None
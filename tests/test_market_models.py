@@ -0,0 +1,35 @@
+# tests/test_market_models.py
+"""Tests for decoding market params into the market models."""
+import pytest
+
+from oracle_analysis.market.models import MarketEventBatch, MarketParams
+
+PARAMS = ('0xLoan', '0xCollateral', '0xOracle', '0xIrm', 860000000000000000)
+DECODED_STRUCT = {
+    'loanToken': '0xLoan',
+    'collateralToken': '0xCollateral',
+    'oracle': '0xOracle',
+    'irm': '0xIrm',
+    'lltv': 860000000000000000
+}
+
+
+@pytest.mark.parametrize('params', [DECODED_STRUCT, PARAMS, list(PARAMS)])
+def test_market_params_from_decoded_struct_or_tuple(params):
+    assert MarketParams.from_tuple(params) == MarketParams(*PARAMS)
+
+
+def test_market_params_rejects_wrong_length():
+    with pytest.raises(ValueError):
+        MarketParams.from_tuple(PARAMS[:4])
+
+
+def test_batch_append_reads_struct_fields_by_name():
+    batch = MarketEventBatch()
+    batch.append('0xid', DECODED_STRUCT, 123, '0xtx', timestamp=456)
+
+    assert batch.oracles == ['0xOracle']
+    assert batch.lltvs == [860000000000000000]
+    (event,) = list(batch)
+    assert event.params == MarketParams(*PARAMS)
+    assert event.timestamp == 456
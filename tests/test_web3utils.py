@@ -0,0 +1,483 @@
+# tests/test_web3utils.py
+"""Behaviour tests for the address, concurrency, rate limiting and RPC helpers in web3utils."""
+import asyncio
+import random
+import threading
+import time
+from types import SimpleNamespace
+
+import orjson
+import pytest
+import requests
+from web3 import Web3
+
+from oracle_analysis.utils import web3utils
+
+
+class FakeClock:
+    """Stand-in for the time module whose sleep advances a virtual clock."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FakeResponse:
+    def __init__(self, payload):
+        self.content = orjson.dumps(payload)
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeSession:
+    """Answers each batch POST with the response built by `respond(payload)`."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.payloads = []
+
+    def post(self, url, data=None, **kwargs):
+        payload = orjson.loads(data)
+        self.payloads.append(payload)
+        return FakeResponse(self.respond(payload))
+
+
+def echo_results(payload):
+    """Answer every call with its own params, in reverse order."""
+    return [
+        {'jsonrpc': '2.0', 'id': call['id'], 'result': call['params'][0]}
+        for call in reversed(payload)
+    ]
+
+
+@pytest.fixture
+def fake_w3():
+    return SimpleNamespace(provider=SimpleNamespace(endpoint_uri='http://node.invalid'))
+
+
+def use_session(monkeypatch, respond):
+    session = FakeSession(respond)
+    monkeypatch.setattr(web3utils, 'get_session', lambda: session)
+    return session
+
+
+# fast_is_checksum_address
+
+EIP55_ADDRESSES = [
+    '0x5aAeb6053F3E94C9b9A09f33669435E7Ef1BeAed',
+    '0xfB6916095ca1df60bB79Ce92cE3Ea74c37c5d359',
+    '0xdbF03B407c01E7cD3CBea99509d93f8DDDC8C6FB',
+    '0xD1220A0cf47c7B9Be7A2E6BA89F429762e7b9aDb',
+]
+
+
+def flip_first_letter(address):
+    index = next(i for i, char in enumerate(address[2:], 2) if char.isalpha())
+    return address[:index] + address[index].swapcase() + address[index + 1:]
+
+
+@pytest.mark.parametrize('address, expected', [
+    *[(address, True) for address in EIP55_ADDRESSES],
+    *[(address.lower(), False) for address in EIP55_ADDRESSES],
+    *[(flip_first_letter(address), False) for address in EIP55_ADDRESSES],
+    (EIP55_ADDRESSES[0][2:], False),             # missing 0x
+    ('0X' + EIP55_ADDRESSES[0][2:], False),      # uppercase prefix
+    ('0x' + 'g' * 40, False),                    # not hex
+    (EIP55_ADDRESSES[0] + '00', False),          # too long
+    ('', False),
+])
+def test_fast_is_checksum_address(address, expected):
+    assert web3utils.fast_is_checksum_address(address) is expected
+    assert Web3.is_checksum_address(address) is expected
+
+
+def test_fast_is_checksum_address_agrees_with_web3():
+    rng = random.Random(5)
+    for _ in range(200):
+        address = Web3.to_checksum_address('0x' + rng.randbytes(20).hex())
+        letters = [i for i, char in enumerate(address[2:], 2) if char.isalpha()]
+        if letters and rng.random() < 0.5:
+            i = rng.choice(letters)
+            address = address[:i] + address[i].swapcase() + address[i + 1:]
+        assert web3utils.fast_is_checksum_address(address) == Web3.is_checksum_address(address)
+
+
+# retry_web3_call
+
+def http_error(status, retry_after=None):
+    response = requests.Response()
+    response.status_code = status
+    if retry_after is not None:
+        response.headers['Retry-After'] = retry_after
+    return requests.HTTPError(f'{status} error', response=response)
+
+
+@pytest.fixture(params=['sync', 'async'])
+def call_with_retries(request, monkeypatch):
+    """
+    Run a retried call that raises the given errors first.
+    Returns its result (or the exception it raised), attempt count and sleeps.
+    """
+    clock = FakeClock()
+    monkeypatch.setattr(web3utils, 'time', clock)
+
+    async def async_sleep(seconds):
+        clock.sleep(seconds)
+
+    monkeypatch.setattr(asyncio, 'sleep', async_sleep)
+
+    def call(*errors, **retry_kwargs):
+        errors = list(errors)
+        calls = []
+
+        def attempt():
+            calls.append(len(calls))
+            if errors:
+                raise errors.pop(0)
+            return 'ok'
+
+        async def async_attempt():
+            return attempt()
+
+        try:
+            if request.param == 'async':
+                result = asyncio.run(web3utils.retry_web3_call(**retry_kwargs)(async_attempt)())
+            else:
+                result = web3utils.retry_web3_call(**retry_kwargs)(attempt)()
+        except requests.HTTPError as e:
+            result = e
+        return result, len(calls), clock.sleeps
+
+    return call
+
+
+@pytest.mark.parametrize('status', [400, 401, 404])
+def test_retry_fails_fast_on_client_errors(call_with_retries, status):
+    error = http_error(status)
+    assert call_with_retries(error) == (error, 1, [])
+
+
+def test_retry_waits_for_retry_after(call_with_retries):
+    assert call_with_retries(http_error(429, '7'), delay=1.0) == ('ok', 2, [7.0])
+
+
+def test_retry_without_retry_after_uses_backoff(call_with_retries):
+    result = call_with_retries(http_error(429), http_error(429), delay=1.0, backoff=2.0)
+    assert result == ('ok', 3, [1.0, 2.0])
+
+
+def test_retry_reraises_retry_after_beyond_limit(monkeypatch, call_with_retries):
+    monkeypatch.setattr(web3utils.Config, 'REQUEST_TIMEOUT', 30)
+    error = http_error(429, '3600')
+    assert call_with_retries(error, delay=1.0) == (error, 1, [])
+
+
+def test_retry_allows_retry_after_up_to_request_timeout(monkeypatch, call_with_retries):
+    monkeypatch.setattr(web3utils.Config, 'REQUEST_TIMEOUT', 30)
+    assert call_with_retries(http_error(429, '30'), delay=1.0) == ('ok', 2, [30.0])
+
+
+def test_retry_jitters_server_errors_within_a_quarter(call_with_retries):
+    errors = [http_error(503) for _ in range(3)]
+    result, calls, sleeps = call_with_retries(*errors, delay=1.0, backoff=2.0)
+
+    assert (result, calls) == ('ok', 4)
+    for sleep, base in zip(sleeps, [1.0, 2.0, 4.0]):
+        assert base <= sleep <= base * 1.25
+
+
+def test_retry_gives_up_after_max_retries(call_with_retries):
+    errors = [http_error(503) for _ in range(3)]
+    result, calls, sleeps = call_with_retries(*errors, max_retries=2)
+    assert (result, calls, len(sleeps)) == (errors[2], 3, 2)
+
+
+# single_flight
+
+def test_single_flight_coalesces_concurrent_calls():
+    calls = []
+    started = threading.Event()
+    release = threading.Event()
+
+    @web3utils.single_flight(key=lambda x: x)
+    def lookup(x):
+        calls.append(x)
+        started.set()
+        release.wait(5)
+        return x * 2
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(lookup(21)))
+    leader.start()
+    assert started.wait(5)
+
+    followers = [threading.Thread(target=lambda: results.append(lookup(21))) for _ in range(5)]
+    for thread in followers:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in [leader, *followers]:
+        thread.join(5)
+
+    assert calls == [21]
+    assert results == [42] * 6
+    assert not web3utils._inflight
+
+
+def test_single_flight_propagates_errors_to_waiters():
+    started = threading.Event()
+    release = threading.Event()
+
+    @web3utils.single_flight(key=lambda x: x)
+    def failing(x):
+        started.set()
+        release.wait(5)
+        raise ValueError('boom')
+
+    errors = []
+
+    def call():
+        try:
+            failing(1)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=call)]
+    threads[0].start()
+    assert started.wait(5)
+    threads += [threading.Thread(target=call) for _ in range(3)]
+    for thread in threads[1:]:
+        thread.start()
+    time.sleep(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(5)
+
+    assert errors == ['boom'] * 4
+    assert not web3utils._inflight
+
+
+def test_single_flight_does_not_cache_after_completion():
+    calls = []
+
+    @web3utils.single_flight(key=lambda x: x)
+    def lookup(x):
+        calls.append(x)
+        return len(calls)
+
+    assert lookup('a') == 1
+    assert lookup('a') == 2
+    assert calls == ['a', 'a']
+
+
+# _RateLimiter
+
+def test_rate_limiter_allows_burst_then_paces(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(web3utils, 'time', clock)
+    limiter = web3utils._RateLimiter(5)
+
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+    for _ in range(3):
+        limiter.acquire()
+    assert clock.sleeps == pytest.approx([0.2, 0.2, 0.2])
+
+
+def test_rate_limiter_refills_while_idle(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(web3utils, 'time', clock)
+    limiter = web3utils._RateLimiter(5)
+
+    for _ in range(5):
+        limiter.acquire()
+    clock.now += 1.0
+
+    for _ in range(5):
+        limiter.acquire()
+    assert clock.sleeps == []
+
+
+# block_at_timestamp
+
+BLOCK_TIMESTAMPS = [100, 112, 124, 124, 136, 160]
+
+
+@pytest.fixture
+def chain(monkeypatch):
+    lookups = []
+
+    def get_block_timestamp(w3, number):
+        lookups.append(number)
+        return BLOCK_TIMESTAMPS[number]
+
+    monkeypatch.setattr(web3utils, 'get_block_timestamp', get_block_timestamp)
+    w3 = SimpleNamespace(eth=SimpleNamespace(block_number=len(BLOCK_TIMESTAMPS) - 1))
+    return w3, lookups
+
+
+@pytest.mark.parametrize('timestamp, expected', [
+    (0, 0),      # before genesis
+    (100, 0),    # genesis itself
+    (101, 1),    # between blocks rounds up
+    (124, 2),    # first of several blocks with the same timestamp
+    (160, 5),    # the head
+    (10**9, 5),  # after the head
+])
+def test_block_at_timestamp(chain, timestamp, expected):
+    w3, _ = chain
+    assert web3utils.block_at_timestamp(w3, timestamp) == expected
+
+
+def test_block_at_timestamp_uses_log_lookups(chain):
+    w3, lookups = chain
+    web3utils.block_at_timestamp(w3, 130)
+    assert len(lookups) <= 3
+
+
+def test_block_at_timestamp_respects_high(chain):
+    w3, lookups = chain
+    assert web3utils.block_at_timestamp(w3, 10**9, high=3) == 3
+    assert max(lookups) < 3
+
+
+# batch_rpc_request
+
+def test_batch_rpc_request_maps_responses_by_id(monkeypatch, fake_w3):
+    session = use_session(monkeypatch, echo_results)
+    params = [[n] for n in range(7)]
+
+    assert web3utils.batch_rpc_request(fake_w3, 'eth_test', params, batch_size=3) == list(range(7))
+    assert [len(payload) for payload in session.payloads] == [3, 3, 1]
+
+
+def test_batch_rpc_request_rejects_missing_ids(monkeypatch, fake_w3):
+    use_session(monkeypatch, lambda payload: echo_results(payload)[1:])
+
+    with pytest.raises(ValueError, match='missing ids'):
+        web3utils.batch_rpc_request(fake_w3, 'eth_test', [[1], [2], [3]])
+
+
+@pytest.mark.parametrize('bad_id', [7, -1, '0', None])
+def test_batch_rpc_request_rejects_unexpected_ids(monkeypatch, fake_w3, bad_id):
+    def respond(payload):
+        results = echo_results(payload)
+        results[0]['id'] = bad_id
+        return results
+
+    use_session(monkeypatch, respond)
+
+    with pytest.raises(ValueError, match='Unexpected id'):
+        web3utils.batch_rpc_request(fake_w3, 'eth_test', [[1], [2]])
+
+
+def test_batch_rpc_request_rejects_duplicate_ids(monkeypatch, fake_w3):
+    use_session(monkeypatch, lambda payload: echo_results(payload) + echo_results(payload)[:1])
+
+    with pytest.raises(ValueError, match='Unexpected id'):
+        web3utils.batch_rpc_request(fake_w3, 'eth_test', [[1], [2]])
+
+
+def test_batch_rpc_request_reports_error_with_null_id(monkeypatch, fake_w3):
+    use_session(monkeypatch, lambda payload: [
+        {'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'Invalid Request'}},
+        *echo_results(payload)
+    ])
+
+    with pytest.raises(ValueError, match='Invalid Request'):
+        web3utils.batch_rpc_request(fake_w3, 'eth_test', [[1], [2]])
+
+
+def test_batch_rpc_request_rejects_non_batch_answer(monkeypatch, fake_w3):
+    use_session(monkeypatch, lambda payload: {
+        'jsonrpc': '2.0', 'id': None, 'error': {'code': -32600, 'message': 'batch not supported'}
+    })
+
+    with pytest.raises(ValueError, match='rejected'):
+        web3utils.batch_rpc_request(fake_w3, 'eth_test', [[1], [2]])
+
+
+# get_contract_creators
+
+ADDRESSES = [f'0x{n:040x}' for n in range(7)]
+
+
+class FakeEtherscan:
+    """Answers each Etherscan GET with the response built by `respond(addresses)`."""
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+
+    def get(self, url, params=None, **kwargs):
+        addresses = params['contractaddresses'].split(',')
+        self.requests.append(addresses)
+        return FakeResponse(self.respond(addresses))
+
+
+def creation_records(addresses):
+    return {
+        'status': '1',
+        'message': 'OK',
+        'result': [
+            {'contractAddress': address.lower(), 'contractCreator': f'creator-of-{address}'}
+            for address in addresses if address != ADDRESSES[1]
+        ]
+    }
+
+
+def use_etherscan(monkeypatch, respond):
+    etherscan = FakeEtherscan(respond)
+    monkeypatch.setattr(web3utils, 'get_session', lambda: etherscan)
+    monkeypatch.setattr(web3utils, 'time', FakeClock())
+    return etherscan
+
+
+def test_get_contract_creators_maps_records_per_chunk(monkeypatch):
+    etherscan = use_etherscan(monkeypatch, creation_records)
+
+    creators = web3utils.get_contract_creators(ADDRESSES, etherscan_api_key='key')
+
+    assert [len(chunk) for chunk in etherscan.requests] == [5, 2]
+    assert creators[ADDRESSES[0]] == f'creator-of-{ADDRESSES[0]}'
+    assert creators[ADDRESSES[1]] is None
+    assert list(creators) == ADDRESSES
+
+
+def test_get_contract_creators_treats_no_data_as_no_record(monkeypatch):
+    use_etherscan(monkeypatch, lambda addresses: {
+        'status': '0', 'message': 'No data found', 'result': []
+    })
+
+    assert web3utils.get_contract_creators(ADDRESSES, etherscan_api_key='key') == dict.fromkeys(ADDRESSES)
+
+
+def test_get_contract_creators_raises_on_notok_chunk(monkeypatch):
+    def respond(addresses):
+        if addresses[0] == ADDRESSES[0]:
+            return creation_records(addresses)
+        return {'status': '0', 'message': 'NOTOK', 'result': 'Max rate limit reached'}
+
+    use_etherscan(monkeypatch, respond)
+
+    with pytest.raises(ValueError, match='Max rate limit reached'):
+        web3utils.get_contract_creators(ADDRESSES, etherscan_api_key='key')
+
+
+def test_get_contract_creators_requires_api_key(monkeypatch):
+    etherscan = use_etherscan(monkeypatch, creation_records)
+    monkeypatch.setattr(web3utils.Config, 'ETHERSCAN_API_KEY', None)
+
+    with pytest.raises(ValueError, match='No Etherscan API key'):
+        web3utils.get_contract_creators(ADDRESSES)
+    assert etherscan.requests == []